@@ -58,7 +58,7 @@ dlt_expectations = dlt_generator.generate_dlt_rules(profiles, language="Python_D
 print(dlt_expectations)
 
 # save generated checks in a workspace file
-user_name = spark.sql("select current_user() as user").collect()[0]["user"]
+user_name = ws.current_user.me().user_name
 checks_file = f"/Workspace/Users/{user_name}/dqx_demo_checks.yml"
 dq_engine = DQEngine(ws)
 dq_engine.save_checks_in_workspace_file(checks, workspace_path=checks_file)
@@ -281,22 +281,39 @@ assert not status.has_errors
 
 dq_engine = DQEngine(WorkspaceClient())
 
-# read the data, limit to 1000 rows for demo purpose
-bronze_df = spark.read.format("delta").load("/databricks-datasets/delta-sharing/samples/nyctaxi_2019").limit(1000)
+# read only the columns used by the business logic and quality checks so that unused columns are not scanned
+bronze_columns = [
+    "vendor_id",
+    "pickup_datetime",
+    "dropoff_datetime",
+    "passenger_count",
+    "trip_distance",
+    "pickup_longitude",
+    "pickup_latitude",
+    "dropoff_longitude",
+    "dropoff_latitude",
+    "tip_amount",
+    "total_amount",
+]
+bronze_df = spark.read.format("delta").load("/databricks-datasets/delta-sharing/samples/nyctaxi_2019").select(*bronze_columns)
 
 # apply your business logic here
-bronze_transformed_df = bronze_df.filter("vendor_id in (1, 2)")
+# filter before limiting so that the predicate is pushed down to the Delta scan, limit to 1000 rows for demo purpose
+bronze_transformed_df = bronze_df.filter("vendor_id in (1, 2)").limit(1000)
+
+# cache the input since both the valid and the quarantined data displayed below are computed from it
+bronze_transformed_df = bronze_transformed_df.cache()
 
 # apply quality checks
 silver_df, quarantine_df = dq_engine.apply_checks_by_metadata_and_split(bronze_transformed_df, checks)
 
 # COMMAND ----------
 
-display(silver_df)
+display(silver_df.limit(20))
 
 # COMMAND ----------
 
-display(quarantine_df)
+display(quarantine_df.limit(20))
 
 # COMMAND ----------
 
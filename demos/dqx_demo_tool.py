@@ -42,17 +42,50 @@
 
 # COMMAND ----------
 
-import glob
 import os
+import re
+from packaging.version import Version
+from databricks.sdk import WorkspaceClient
 
-user_name = spark.sql("select current_user() as user").collect()[0]["user"]
-dqx_wheel_files = glob.glob(f"/Workspace/Users/{user_name}/.dqx/wheels/databricks_labs_dqx-*.whl")
-dqx_latest_wheel = max(dqx_wheel_files, key=os.path.getctime)
+user_name = WorkspaceClient().current_user.me().user_name
+# wheel file names embed the version (databricks_labs_dqx-<version>-py3-none-any.whl),
+# so the latest wheel is selected by comparing versions, without reading file attributes
+dqx_wheel_pattern = re.compile(r"^databricks_labs_dqx-([^-]+)-.*\.whl$")
+with os.scandir(f"/Workspace/Users/{user_name}/.dqx/wheels") as entries:
+    dqx_wheel_files = {
+        entry.path: Version(match.group(1)) for entry in entries if (match := dqx_wheel_pattern.match(entry.name))
+    }
+dqx_latest_wheel = max(dqx_wheel_files, key=dqx_wheel_files.__getitem__)
 %pip install {dqx_latest_wheel}
 %restart_python
 
 # COMMAND ----------
 
+# MAGIC %md
+# MAGIC ### Import modules, initialize DQX engine, load the run configuration and read the input data
+# MAGIC
+# MAGIC All imports are done once here, and the workspace client, engine, run configuration and input data are created once and reused by all cells below.
+
+# COMMAND ----------
+
+from concurrent.futures import ThreadPoolExecutor
+import yaml
+from databricks.labs.dqx.contexts.workspace import WorkspaceContext
+from databricks.labs.dqx.engine import DQEngine
+from databricks.labs.dqx.profiler.generator import DQGenerator
+from databricks.labs.dqx.profiler.profiler import DQProfiler
+from databricks.labs.dqx.utils import read_input_data
+from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors import NotFound
+
+ws = WorkspaceClient()
+dq_engine = DQEngine(ws)
+run_config = dq_engine.load_run_config(run_config_name="default", assume_user=True)
+# read the input data once, it is used both by the profiler and when applying the checks
+input_df = read_input_data(spark, run_config.input_location, run_config.input_format)
+
+# COMMAND ----------
+
 # MAGIC %md
 # MAGIC ### Run profiler workflow to generate quality rule candidates
 # MAGIC
@@ -73,23 +106,10 @@ dqx_latest_wheel = max(dqx_wheel_files, key=os.path.getctime)
 
 # COMMAND ----------
 
-import yaml
-from databricks.labs.dqx.profiler.profiler import DQProfiler
-from databricks.labs.dqx.profiler.generator import DQGenerator
-from databricks.labs.dqx.engine import DQEngine
-from databricks.labs.dqx.utils import read_input_data
-from databricks.sdk import WorkspaceClient
-
-ws = WorkspaceClient()
-dq_engine = DQEngine(ws)
-run_config = dq_engine.load_run_config(run_config_name="default", assume_user=True)
-
-# read the input data, limit to 1000 rows for demo purpose
-input_df = read_input_data(spark, run_config.input_location, run_config.input_format).limit(1000)
-
-# profile the input data
+# profile a random sample of the input data for demo purpose
+# sampling is distributed across all input partitions, unlike limit which only reads the first rows
 profiler = DQProfiler(ws)
-summary_stats, profiles = profiler.profile(input_df)
+summary_stats, profiles = profiler.profile(input_df, opts={"sample_fraction": 0.001, "sample_seed": 42})
 print(summary_stats)
 print(profiles)
 
@@ -112,54 +132,56 @@ dq_engine.save_checks_in_installation(checks, run_config_name="default")
 
 # COMMAND ----------
 
-import yaml
-from databricks.labs.dqx.engine import DQEngine
-from databricks.sdk import WorkspaceClient
-
-checks = yaml.safe_load("""
-- check:
-    function: is_not_null
-    arguments:
-      col_names:
-        - vendor_id
-        - pickup_datetime
-        - dropoff_datetime
-        - passenger_count
-        - trip_distance
-        - pickup_longitude
-        - pickup_latitude
-        - dropoff_longitude
-        - dropoff_latitude
-  criticality: warn
-  filter: total_amount > 0
-- check:
-    function: is_not_less_than
-    arguments:
-      col_name: trip_distance
-      limit: 1
-  criticality: error
-  filter: tip_amount > 0
-- check:
-    function: sql_expression
-    arguments:
-      expression: pickup_datetime <= dropoff_datetime
-      msg: pickup time must not be greater than dropff time
-      name: pickup_datetime_greater_than_dropoff_datetime
-  criticality: error
-- check:
-    function: is_not_in_future
-    arguments:
-      col_name: pickup_datetime
-  name: pickup_datetime_not_in_future
-  criticality: warn
-""")
+# checks can also be defined as python dictionaries, without parsing yaml
+checks = [
+    {
+        "check": {
+            "function": "is_not_null",
+            "arguments": {
+                "col_names": [
+                    "vendor_id",
+                    "pickup_datetime",
+                    "dropoff_datetime",
+                    "passenger_count",
+                    "trip_distance",
+                    "pickup_longitude",
+                    "pickup_latitude",
+                    "dropoff_longitude",
+                    "dropoff_latitude",
+                ]
+            },
+        },
+        "criticality": "warn",
+        "filter": "total_amount > 0",
+    },
+    {
+        "check": {"function": "is_not_less_than", "arguments": {"col_name": "trip_distance", "limit": 1}},
+        "criticality": "error",
+        "filter": "tip_amount > 0",
+    },
+    {
+        "check": {
+            "function": "sql_expression",
+            "arguments": {
+                "expression": "pickup_datetime <= dropoff_datetime",
+                "msg": "pickup time must not be greater than dropff time",
+                "name": "pickup_datetime_greater_than_dropoff_datetime",
+            },
+        },
+        "criticality": "error",
+    },
+    {
+        "check": {"function": "is_not_in_future", "arguments": {"col_name": "pickup_datetime"}},
+        "name": "pickup_datetime_not_in_future",
+        "criticality": "warn",
+    },
+]
 
 # validate the checks
 status = DQEngine.validate_checks(checks)
 print(status)
 assert not status.has_errors
 
-dq_engine = DQEngine(WorkspaceClient())
 # save checks to location specified in the default run configuration inside workspace installation folder
 dq_engine.save_checks_in_installation(checks, run_config_name="default")
 # or save it to an arbitrary workspace location
@@ -172,29 +194,35 @@ dq_engine.save_checks_in_installation(checks, run_config_name="default")
 
 # COMMAND ----------
 
-from databricks.labs.dqx.engine import DQEngine
-from databricks.labs.dqx.utils import read_input_data
-from databricks.sdk import WorkspaceClient
-
-run_config = dq_engine.load_run_config(run_config_name="default", assume_user=True)
-
-# read the data, limit to 1000 rows for demo purpose
-bronze_df = read_input_data(spark, run_config.input_location, run_config.input_format).limit(1000)
-
-# apply your business logic here
-bronze_transformed_df = bronze_df.filter("vendor_id in (1, 2)")
-
-dq_engine = DQEngine(WorkspaceClient())
-
 # load checks from location defined in the run configuration
 checks = dq_engine.load_checks_from_installation(assume_user=True, run_config_name="default")
 # or load checks from arbitrary workspace file
 # checks = dq_engine.load_checks_from_workspace_file(workspace_path="/Shared/App1/checks.yml")
 print(checks)
 
+# reuse the input data read in the setup cell instead of reading it again, and select only the columns
+# used by the checks and the business logic so that unused columns are not scanned:
+# the columns checked are taken from the `col_name`/`col_names` arguments of the checks, while the columns
+# used in sql expressions, filters and the business logic cannot be derived and are listed explicitly
+bronze_columns = {"vendor_id", "pickup_datetime", "dropoff_datetime", "total_amount", "tip_amount"}
+for check in checks:
+    arguments = check["check"].get("arguments", {})
+    bronze_columns.update(arguments.get("col_names", []))
+    if "col_name" in arguments:
+        bronze_columns.add(arguments["col_name"])
+bronze_df = input_df.select(*[col for col in input_df.columns if col in bronze_columns])
+
+# apply your business logic here
+# filter before limiting so that the predicate is pushed down to the Delta scan, limit to 1000 rows for demo purpose
+bronze_transformed_df = bronze_df.filter("vendor_id in (1, 2)").limit(1000)
+
+# cache the input since the checked data is consumed by multiple actions below (display, write)
+bronze_transformed_df = bronze_transformed_df.cache()
+
 # Option 1: apply quality rules and quarantine invalid records
 silver_df, quarantine_df = dq_engine.apply_checks_by_metadata_and_split(bronze_transformed_df, checks)
-display(quarantine_df)
+# display only a sample of the quarantined records, the full data is saved to a table below
+display(quarantine_df.limit(20))
 
 # Option 2: apply quality rules and flag invalid records as additional columns (`_warning` and `_error`)
 #silver_valid_and_quarantine_df = dq_engine.apply_checks_by_metadata(bronze_transformed_df, checks)
@@ -213,10 +241,26 @@ display(quarantine_df)
 print(f"Saving quarantined data to {run_config.quarantine_table}")
 quarantine_catalog, quarantine_schema, _ = run_config.quarantine_table.split(".")
 
-spark.sql(f"CREATE CATALOG IF NOT EXISTS {quarantine_catalog}")
-spark.sql(f"CREATE SCHEMA IF NOT EXISTS {quarantine_catalog}.{quarantine_schema}")
-
-quarantine_df.write.mode("overwrite").saveAsTable(run_config.quarantine_table)
+# create the catalog and schema using the SDK to avoid running Spark jobs for the DDL statements
+try:
+    ws.catalogs.get(quarantine_catalog)
+except NotFound:
+    ws.catalogs.create(name=quarantine_catalog)
+try:
+    ws.schemas.get(f"{quarantine_catalog}.{quarantine_schema}")
+except NotFound:
+    ws.schemas.create(name=quarantine_schema, catalog_name=quarantine_catalog)
+
+# the demo data is small, so write it as a single file instead of one small file per input partition
+# the write runs in the background while the dashboard link is resolved in the next cell
+executor = ThreadPoolExecutor(max_workers=1)
+quarantine_write = executor.submit(
+    lambda: quarantine_df.coalesce(1)
+    .write.format("delta")
+    .mode("overwrite")
+    .option("overwriteSchema", "true")
+    .saveAsTable(run_config.quarantine_table)
+)
 
 # COMMAND ----------
 
@@ -225,9 +269,12 @@ quarantine_df.write.mode("overwrite").saveAsTable(run_config.quarantine_table)
 
 # COMMAND ----------
 
-from databricks.labs.dqx.contexts.workspace import WorkspaceContext
-
-ctx = WorkspaceContext(WorkspaceClient())
+ctx = WorkspaceContext(ws)
 dashboards_folder_link = f"{ctx.installation.workspace_link('')}dashboards/"
 print(f"Open a dashboard from the following folder and refresh it:")
-print(dashboards_folder_link)
\ No newline at end of file
+print(dashboards_folder_link)
+
+# make sure the quarantined data is saved before refreshing the dashboard
+quarantine_write.result()
+executor.shutdown()
+print(f"Quarantined data saved to {run_config.quarantine_table}")
\ No newline at end of file
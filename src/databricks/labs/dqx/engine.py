@@ -1,16 +1,17 @@
+import io
 import logging
 import os
 import functools as ft
 import inspect
-import itertools
 from pathlib import Path
 from collections.abc import Callable
 from typing import Any
 import yaml
 import pyspark.sql.functions as F
-from pyspark.sql import DataFrame
+from pyspark.sql import Column, DataFrame
 
 from databricks.labs.blueprint.installation import Installation
+from databricks.labs.blueprint.parallel import Threads
 from databricks.labs.dqx import col_functions
 from databricks.labs.dqx.base import DQEngineBase, DQEngineCoreBase
 from databricks.labs.dqx.config import WorkspaceConfig, RunConfig
@@ -22,15 +23,51 @@ from databricks.labs.dqx.rule import (
     ColumnArguments,
     ExtraParams,
     DefaultColumnNames,
+    _VALID_CRITICALITIES,
+    _cached_signature,
+    _cached_param_names,
 )
-from databricks.labs.dqx.schema import dq_result_schema
+from databricks.labs.dqx.schema import dq_result_schema, dq_result_item_schema
 from databricks.labs.dqx.utils import deserialize_dicts
 from databricks.sdk.errors import NotFound
 from databricks.sdk.service.workspace import ImportFormat
 from databricks.sdk import WorkspaceClient
 
+try:  # use the libyaml based dumper if PyYAML was built with it
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlDumper  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# predefined check functions by name, i.e. the public functions defined in the col_functions module
+_PREDEFINED_CHECK_FUNCTIONS: dict[str, Callable] = {
+    name: func
+    for name, func in vars(col_functions).items()
+    if inspect.isfunction(func) and not name.startswith("_") and func.__module__ == col_functions.__name__
+}
+
+
+def _serialize_checks(checks: list[dict]) -> bytes:
+    """Serialize checks to utf-8 encoded YAML, written directly into a bytes buffer."""
+    buffer = io.BytesIO()
+    yaml.dump(checks, buffer, Dumper=YamlDumper, encoding="utf-8")
+    return buffer.getvalue()
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a column name to be used in a SQL expression."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+# type of the run time field of the reporting columns
+_RUN_TIME_TYPE = dq_result_item_schema["run_time"].dataType
+
+
+def _empty_results_column() -> Column:
+    """Null column of the reporting columns type, used when there are no check results."""
+    return F.lit(None).cast(dq_result_schema)
+
 
 class DQEngineCore(DQEngineCoreBase):
     """Data Quality Engine Core class to apply data quality checks to a given dataframe.
@@ -44,14 +81,12 @@ class DQEngineCore(DQEngineCoreBase):
 
         extra_params = extra_params or ExtraParams()
 
-        self._column_names = {
-            ColumnArguments.ERRORS: extra_params.column_names.get(
-                ColumnArguments.ERRORS.value, DefaultColumnNames.ERRORS.value
-            ),
-            ColumnArguments.WARNINGS: extra_params.column_names.get(
-                ColumnArguments.WARNINGS.value, DefaultColumnNames.WARNINGS.value
-            ),
-        }
+        self._errors_col_name = extra_params.column_names.get(
+            ColumnArguments.ERRORS.value, DefaultColumnNames.ERRORS.value
+        )
+        self._warnings_col_name = extra_params.column_names.get(
+            ColumnArguments.WARNINGS.value, DefaultColumnNames.WARNINGS.value
+        )
 
         self.run_time = extra_params.run_time
         self.user_metadata = extra_params.user_metadata
@@ -60,11 +95,14 @@ class DQEngineCore(DQEngineCoreBase):
         if not checks:
             return self._append_empty_checks(df)
 
-        warning_checks = self._get_check_columns(checks, Criticality.WARN.value)
-        error_checks = self._get_check_columns(checks, Criticality.ERROR.value)
-        ndf = self._create_results_map(df, error_checks, self._column_names[ColumnArguments.ERRORS])
-        ndf = self._create_results_map(ndf, warning_checks, self._column_names[ColumnArguments.WARNINGS])
-        return ndf
+        error_results, warning_results = self._build_check_results(checks)
+
+        # both reporting columns are added in a single projection
+        return df.select(
+            "*",
+            self._create_results_map(error_results, self._errors_col_name),
+            self._create_results_map(warning_results, self._warnings_col_name),
+        )
 
     def apply_checks_and_split(self, df: DataFrame, checks: list[DQRule]) -> tuple[DataFrame, DataFrame]:
         if not checks:
@@ -96,27 +134,16 @@ class DQEngineCore(DQEngineCoreBase):
     def validate_checks(
         checks: list[dict], custom_check_functions: dict[str, Any] | None = None
     ) -> ChecksValidationStatus:
-        status = ChecksValidationStatus()
-
-        for check in checks:
-            logger.debug(f"Processing check definition: {check}")
-            if isinstance(check, dict):
-                status.add_errors(DQEngineCore._validate_checks_dict(check, custom_check_functions))
-            else:
-                status.add_error(f"Unsupported check type: {type(check)}")
-
-        return status
+        # functions are resolved once per name and reused for all checks referring to them
+        return DQEngineCore._validate_checks(checks, custom_check_functions, resolved_functions={})
 
     def get_invalid(self, df: DataFrame) -> DataFrame:
-        return df.where(
-            F.col(self._column_names[ColumnArguments.ERRORS]).isNotNull()
-            | F.col(self._column_names[ColumnArguments.WARNINGS]).isNotNull()
-        )
+        errors, warnings = _quote_identifier(self._errors_col_name), _quote_identifier(self._warnings_col_name)
+        return df.where(f"{errors} IS NOT NULL OR {warnings} IS NOT NULL")
 
     def get_valid(self, df: DataFrame) -> DataFrame:
-        return df.where(F.col(self._column_names[ColumnArguments.ERRORS]).isNull()).drop(
-            self._column_names[ColumnArguments.ERRORS], self._column_names[ColumnArguments.WARNINGS]
-        )
+        errors = _quote_identifier(self._errors_col_name)
+        return df.where(f"{errors} IS NULL").drop(self._errors_col_name, self._warnings_col_name)
 
     @staticmethod
     def load_checks_from_local_file(filepath: str) -> list[dict]:
@@ -137,7 +164,7 @@ class DQEngineCore(DQEngineCoreBase):
 
         try:
             with open(filepath, 'w', encoding="utf-8") as file:
-                yaml.safe_dump(checks, file)
+                yaml.dump(checks, file, Dumper=YamlDumper)
         except FileNotFoundError:
             msg = f"Checks file {filepath} missing"
             raise FileNotFoundError(msg) from None
@@ -156,24 +183,27 @@ class DQEngineCore(DQEngineCoreBase):
         If not specified, then only built-in functions are used for the checks.
         :return: list of data quality check rules
         """
-        status = DQEngineCore.validate_checks(checks, custom_checks)
+        # the functions resolved during validation are reused to build the rules
+        resolved_functions: dict[str, Callable | None] = {}
+        status = DQEngineCore._validate_checks(checks, custom_checks, resolved_functions)
         if status.has_errors:
             raise ValueError(str(status))
 
         dq_rule_checks = []
         for check_def in checks:
-            logger.debug(f"Processing check definition: {check_def}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing check definition: {check_def}")
 
-            check = check_def.get("check", {})
-            name = check_def.get("name", None)
-            func_name = check.get("function")
-            func = DQEngineCore.resolve_check_function(func_name, custom_checks, fail_on_missing=True)
+            # the `check` block and its `function` are guaranteed to be present by the validation
+            check = check_def["check"]
+            func = resolved_functions[check["function"]]
             assert func  # should already be validated
 
-            func_args = check.get("arguments", {})
+            func_args = check.get("arguments") or {}
             col_names = func_args.get("col_names")
             col_name = func_args.get("col_name")
-            criticality = check_def.get("criticality", "error")
+            name = check_def.get("name")
+            criticality = check_def.get("criticality", Criticality.ERROR.value)
             filter_expr = check_def.get("filter")
 
             # Exclude `col_names` and `col_name` from check_func_kwargs
@@ -181,7 +211,8 @@ class DQEngineCore(DQEngineCoreBase):
             check_func_kwargs = {k: v for k, v in func_args.items() if k not in {"col_names", "col_name"}}
 
             if col_names:
-                logger.debug(f"Adding DQRuleColSet with columns: {col_names}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Adding DQRuleColSet with columns: {col_names}")
                 dq_rule_checks += DQRuleColSet(
                     columns=col_names,
                     name=name,
@@ -213,10 +244,10 @@ class DQEngineCore(DQEngineCoreBase):
         :param rules_col_set: list of dq rules which define multiple columns for the same check function
         :return: list of dq rules
         """
-        rules_nested = [rule_set.get_rules() for rule_set in rules_col_set]
-        flat_rules = list(itertools.chain(*rules_nested))
-
-        return list(filter(None, flat_rules))
+        rules: list[DQRule] = []
+        for rule_set in rules_col_set:
+            rules.extend(rule for rule in rule_set.get_rules() if rule)
+        return rules
 
     @staticmethod
     def resolve_check_function(
@@ -230,24 +261,58 @@ class DQEngineCore(DQEngineCoreBase):
         :param fail_on_missing: if True, raise an AttributeError if the function is not found.
         :return: function or None if not found.
         """
-        logger.debug(f"Resolving function: {function_name}")
-        func = getattr(col_functions, function_name, None)  # resolve using predefined checks first
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Resolving function: {function_name}")
+        func = _PREDEFINED_CHECK_FUNCTIONS.get(function_name)  # resolve using predefined checks first
         if not func and custom_check_functions:
             func = custom_check_functions.get(function_name)  # returns None if not found
         if fail_on_missing and not func:
             raise AttributeError(f"Function '{function_name}' not found.")
-        logger.debug(f"Function {function_name} resolved successfully: {func}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Function {function_name} resolved successfully: {func}")
         return func
 
-    @staticmethod
-    def _get_check_columns(checks: list[DQRule], criticality: str) -> list[DQRule]:
-        """Get check columns based on criticality.
+    def _build_check_results(self, checks: list[DQRule]) -> tuple[list[Column], list[Column]]:
+        """Build the result struct of each check and split them by criticality, in a single pass over the checks.
 
         :param checks: list of checks to apply to the dataframe
-        :param criticality: criticality
-        :return: list of check columns
+        :return: tuple of error check results and warning check results
         """
-        return [check for check in checks if check.rule_criticality == criticality]
+        # fields shared by all the checks are built once
+        # cast explicitly, as naive datetimes may be inferred as timestamp_ntz depending on the session config
+        run_time_col = F.lit(self.run_time).cast(_RUN_TIME_TYPE)
+        user_metadata_col = F.create_map(
+            *[item for kv in self.user_metadata.items() for item in (F.lit(kv[0]), F.lit(kv[1]))]
+        )
+
+        error_value = Criticality.ERROR.value
+        error_results: list[Column] = []
+        warning_results: list[Column] = []
+        seen_checks: set[tuple] = set()
+        for check in checks:
+            criticality = check.rule_criticality
+
+            # identical checks would report the same result twice, so each is evaluated only once;
+            # checks only sharing a name (e.g. from the same DQRuleColSet) are still kept
+            check_key = (
+                criticality,
+                check.name,
+                check.col_name,
+                check.filter,
+                id(check.check_func),
+                repr(check.check_func_args),
+                repr(check.check_func_kwargs),
+            )
+            if check_key in seen_checks:
+                logger.debug(f"Skipping duplicate check: {check.name}")
+                continue
+            seen_checks.add(check_key)
+
+            # criticality is validated when the rule is created, so it is either error or warn
+            results = error_results if criticality == error_value else warning_results
+            results.append(check.result_struct(run_time_col, user_metadata_col))
+
+        return error_results, warning_results
 
     def _append_empty_checks(self, df: DataFrame) -> DataFrame:
         """Append empty checks at the end of dataframe.
@@ -257,55 +322,76 @@ class DQEngineCore(DQEngineCoreBase):
         """
         return df.select(
             "*",
-            F.lit(None).cast(dq_result_schema).alias(self._column_names[ColumnArguments.ERRORS]),
-            F.lit(None).cast(dq_result_schema).alias(self._column_names[ColumnArguments.WARNINGS]),
+            _empty_results_column().alias(self._errors_col_name),
+            _empty_results_column().alias(self._warnings_col_name),
         )
 
-    def _create_results_map(self, df: DataFrame, checks: list[DQRule], dest_col: str) -> DataFrame:
-        """ ""Create a map from the values of the specified columns, using the column names as a key.  This function is
-        used to collect individual check columns into corresponding errors and/or warnings columns.
+    @staticmethod
+    def _create_results_map(check_results: list[Column], dest_col: str) -> Column:
+        """Create the column collecting the results of the individual checks.  This function is used to build
+        the corresponding errors and/or warnings column.
 
-        :param df: dataframe with added check columns
-        :param checks: list of checks to apply to the dataframe
-        :param dest_col: name of the map column
+        :param check_results: result structs of the checks
+        :param dest_col: name of the results column
+        :return: results column aliased as `dest_col`
         """
-        empty_type = F.lit(None).cast(dq_result_schema).alias(dest_col)
+        empty_type = _empty_results_column()
+
+        if len(check_results) == 0:
+            return empty_type.alias(dest_col)
+
+        # the size check is done on the filtered array, i.e. only on the results of the failed checks
+        m_col = F.filter(F.array(*check_results), lambda v: v.getField("message").isNotNull())
+        return F.when(F.size(m_col) > 0, m_col).otherwise(empty_type).alias(dest_col)
+
+    @staticmethod
+    def _validate_checks(
+        checks: list[dict],
+        custom_check_functions: dict[str, Any] | None,
+        resolved_functions: dict[str, Callable | None],
+    ) -> ChecksValidationStatus:
+        """
+        Validates the checks, resolving the check functions by name along the way.
+
+        Args:
+            checks (list[dict]): The checks to validate.
+            custom_check_functions (dict[str, Any] | None): dictionary with custom check functions.
+            resolved_functions (dict[str, Callable | None]): functions already resolved by name,
+                updated with the functions of the validated checks.
+
+        Returns:
+            ChecksValidationStatus: The validation status.
+        """
+        status = ChecksValidationStatus()
 
-        if len(checks) == 0:
-            return df.select("*", empty_type)
-        check_cols = []
         for check in checks:
-            result = F.struct(
-                F.lit(check.name).alias("name"),
-                check.check_column().alias("message"),
-                F.lit(check.col_name).alias("col_name"),
-                F.lit(check.filter or None).cast("string").alias("filter"),
-                F.lit(check.check_func.__name__).alias("function"),
-                F.lit(self.run_time).alias("run_time"),
-                F.create_map(
-                    *[item for kv in self.user_metadata.items() for item in (F.lit(kv[0]), F.lit(kv[1]))]
-                ).alias("user_metadata"),
-            )
-            check_cols.append(result)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing check definition: {check}")
+            if isinstance(check, dict):
+                status.add_errors(DQEngineCore._validate_checks_dict(check, custom_check_functions, resolved_functions))
+            else:
+                status.add_error(f"Unsupported check type: {type(check)}")
 
-        m_col = F.filter(F.array(*check_cols), lambda v: v.getField("message").isNotNull())
-        return df.withColumn(dest_col, F.when(F.size(m_col) > 0, m_col).otherwise(empty_type))
+        return status
 
     @staticmethod
-    def _validate_checks_dict(check: dict, custom_check_functions: dict[str, Any] | None) -> list[str]:
+    def _validate_checks_dict(
+        check: dict, custom_check_functions: dict[str, Any] | None, resolved_functions: dict[str, Callable | None]
+    ) -> list[str]:
         """
         Validates the structure and content of a given check dictionary.
 
         Args:
             check (dict): The dictionary to validate.
             custom_check_functions (dict[str, Any] | None): dictionary with custom check functions.
+            resolved_functions (dict[str, Callable | None]): functions already resolved by name.
 
         Returns:
             list[str]: The updated list of error messages.
         """
         errors: list[str] = []
 
-        if "criticality" in check and check["criticality"] not in [c.value for c in Criticality]:
+        if "criticality" in check and check["criticality"] not in _VALID_CRITICALITIES:
             errors.append(f"Invalid value for 'criticality' field: {check}")
 
         if "check" not in check:
@@ -313,18 +399,22 @@ class DQEngineCore(DQEngineCoreBase):
         elif not isinstance(check["check"], dict):
             errors.append(f"'check' field should be a dictionary: {check}")
         else:
-            errors.extend(DQEngineCore._validate_check_block(check, custom_check_functions))
+            errors.extend(DQEngineCore._validate_check_block(check, custom_check_functions, resolved_functions))
 
         return errors
 
     @staticmethod
-    def _validate_check_block(check: dict, custom_check_functions: dict[str, Any] | None) -> list[str]:
+    def _validate_check_block(
+        check: dict, custom_check_functions: dict[str, Any] | None, resolved_functions: dict[str, Callable | None]
+    ) -> list[str]:
         """
         Validates a check block within a configuration.
 
         Args:
             check (dict): The entire check configuration.
             custom_check_functions (dict[str, Any] | None): A dictionary with custom check functions.
+            resolved_functions (dict[str, Callable | None]): functions already resolved by name,
+                updated with the function of this check block.
 
         Returns:
             list[str]: The updated list of error messages.
@@ -335,7 +425,11 @@ class DQEngineCore(DQEngineCoreBase):
             return [f"'function' field is missing in the 'check' block: {check}"]
 
         func_name = check_block["function"]
-        func = DQEngineCore.resolve_check_function(func_name, custom_check_functions, fail_on_missing=False)
+        if func_name not in resolved_functions:
+            resolved_functions[func_name] = DQEngineCore.resolve_check_function(
+                func_name, custom_check_functions, fail_on_missing=False
+            )
+        func = resolved_functions[func_name]
         if not callable(func):
             return [f"function '{func_name}' is not defined: {check}"]
 
@@ -359,14 +453,17 @@ class DQEngineCore(DQEngineCoreBase):
             return [f"'arguments' should be a dictionary in the 'check' block: {check}"]
 
         if "col_names" in arguments:
-            if not isinstance(arguments["col_names"], list):
+            col_names = arguments["col_names"]
+            if not isinstance(col_names, list):
                 return [f"'col_names' should be a list in the 'arguments' block: {check}"]
 
-            if len(arguments["col_names"]) == 0:
+            if len(col_names) == 0:
                 return [f"'col_names' should not be empty in the 'arguments' block: {check}"]
 
+            # the function is validated against the first column, passed as `col_name`
+            first_col_name = col_names[0]
             arguments = {
-                'col_name' if k == 'col_names' else k: arguments['col_names'][0] if k == 'col_names' else v
+                'col_name' if k == 'col_names' else k: first_col_name if k == 'col_names' else v
                 for k, v in arguments.items()
             }
             return DQEngineCore._validate_func_args(arguments, func, check)
@@ -384,21 +481,16 @@ class DQEngineCore(DQEngineCoreBase):
         Returns:
             list[str]: The updated list of error messages after validation.
         """
-
-        @ft.lru_cache(None)
-        def cached_signature(check_func):
-            return inspect.signature(check_func)
-
         errors: list[str] = []
-        sig = cached_signature(func)
+        sig = _cached_signature(func)
         if not arguments and sig.parameters:
             errors.append(
                 f"No arguments provided for function '{func.__name__}' in the 'arguments' block: {check}. "
-                f"Expected arguments are: {list(sig.parameters.keys())}"
+                f"Expected arguments are: {_cached_param_names(func)}"
             )
         for arg, value in arguments.items():
             if arg not in sig.parameters:
-                expected_args = list(sig.parameters.keys())
+                expected_args = _cached_param_names(func)
                 errors.append(
                     f"Unexpected argument '{arg}' for function '{func.__name__}' in the 'arguments' block: {check}. "
                     f"Expected arguments are: {expected_args}"
@@ -424,6 +516,8 @@ class DQEngine(DQEngineBase):
     ):
         super().__init__(workspace_client)
         self._engine = engine or DQEngineCore(workspace_client, extra_params)
+        # verified installations per (assume_user, product_name)
+        self._installation_cache: dict[tuple[bool, str], Installation] = {}
 
     def apply_checks(self, df: DataFrame, checks: list[DQRule]) -> DataFrame:
         """Applies data quality checks to a given dataframe.
@@ -599,7 +693,7 @@ class DQEngine(DQEngineBase):
             f"Saving quality rules (checks) to {installation.install_folder()}/{run_config.checks_file} "
             f"in the workspace."
         )
-        installation.upload(run_config.checks_file, yaml.safe_dump(checks).encode('utf-8'))
+        installation.upload(run_config.checks_file, _serialize_checks(checks))
 
     def save_checks_in_workspace_file(self, checks: list[dict], workspace_path: str):
         """Save checks (dq rules) to yml file in the workspace.
@@ -612,9 +706,24 @@ class DQEngine(DQEngineBase):
 
         logger.info(f"Saving quality rules (checks) to {workspace_path} in the workspace.")
         self.ws.workspace.mkdirs(workspace_dir)
-        self.ws.workspace.upload(
-            workspace_path, yaml.safe_dump(checks).encode('utf-8'), format=ImportFormat.AUTO, overwrite=True
-        )
+        self._upload_checks(workspace_path, _serialize_checks(checks))
+
+    def save_checks_in_workspace_files(self, checks_by_path: dict[str, list[dict]]):
+        """Save multiple sets of checks (dq rules) to yml files in the workspace, uploading the files in parallel.
+        This does not require installation of DQX in the workspace.
+
+        :param checks_by_path: dq rules to save, keyed by the destination path of the file in the workspace.
+        """
+        for workspace_dir in {os.path.dirname(workspace_path) for workspace_path in checks_by_path}:
+            self.ws.workspace.mkdirs(workspace_dir)
+
+        # files are serialized upfront so that the upload threads only do I/O
+        upload_tasks = [
+            ft.partial(self._upload_checks, workspace_path, _serialize_checks(checks))
+            for workspace_path, checks in checks_by_path.items()
+        ]
+        logger.info(f"Saving quality rules (checks) to {len(upload_tasks)} files in the workspace.")
+        Threads.strict("saving checks", upload_tasks)
 
     def load_run_config(
         self, run_config_name: str | None = "default", assume_user: bool = True, product_name: str = "dqx"
@@ -629,7 +738,18 @@ class DQEngine(DQEngineBase):
         installation = self._get_installation(assume_user, product_name)
         return self._load_run_config(installation, run_config_name)
 
+    def reset_installation_cache(self):
+        """
+        Forget the installations verified so far, e.g. after DQX was (re)installed in a different location.
+        """
+        self._installation_cache.clear()
+
     def _get_installation(self, assume_user, product_name):
+        key = (assume_user, product_name)
+        installation = self._installation_cache.get(key)
+        if installation is not None:
+            return installation
+
         if assume_user:
             installation = Installation.assume_user_home(self.ws, product_name)
         else:
@@ -637,8 +757,13 @@ class DQEngine(DQEngineBase):
 
         # verify the installation
         installation.current(self.ws, product_name, assume_user=assume_user)
+        self._installation_cache[key] = installation
         return installation
 
+    def _upload_checks(self, workspace_path: str, content: bytes):
+        """Upload serialized checks to a file in the workspace, overwriting the file if it exists."""
+        self.ws.workspace.upload(workspace_path, content, format=ImportFormat.AUTO, overwrite=True)
+
     @staticmethod
     def _load_run_config(installation, run_config_name):
         """Load run configuration from the installation."""
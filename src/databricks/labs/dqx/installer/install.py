@@ -1,12 +1,15 @@
 import re
+import copy
+import hashlib
 import logging
 import dataclasses
 import os
-import time
+import uuid
 import functools
-import glob
-import webbrowser
-from collections.abc import Callable, Iterable
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 from functools import cached_property
 from datetime import timedelta
@@ -21,7 +24,6 @@ from databricks.labs.blueprint.parallel import ManyError, Threads
 from databricks.labs.blueprint.tui import Prompts
 from databricks.labs.blueprint.upgrades import Upgrades
 from databricks.labs.blueprint.wheels import ProductInfo, Version, find_project_root
-from databricks.labs.lsql.dashboards import DashboardMetadata, Dashboards
 from databricks.sdk import WorkspaceClient
 from databricks.sdk.core import with_user_agent_extra
 from databricks.sdk.service.dashboards import LifecycleState
@@ -34,11 +36,13 @@ from databricks.sdk.errors import (
     ResourceAlreadyExists,
     ResourceDoesNotExist,
 )
+from databricks.labs.dqx.installer.workflow_task import Task
 from databricks.labs.dqx.installer.workflows_installer import WorkflowsDeployment
 from databricks.labs.dqx.runtime import Workflows
 from databricks.sdk.retries import retried
 from databricks.sdk.service.sql import (
     CreateWarehouseRequestWarehouseType,
+    EndpointInfo,
     EndpointInfoWarehouseType,
     SpotInstancePolicy,
 )
@@ -52,6 +56,41 @@ logger = logging.getLogger(__name__)
 with_user_agent_extra("cmd", "install")
 
 WAREHOUSE_PREFIX = "DQX Dashboard"
+# fully qualified table name used in the dashboard queries, replaced with the quarantine table on install
+QUERIES_TABLE_PLACEHOLDER = "$catalog.schema.table"
+_MAJOR_MINOR_VERSION = re.compile(r"(\d+\.\d+)")
+
+
+@functools.cache
+def _workflow_task_definitions() -> tuple[Task, ...]:
+    """Get the tasks of all the DQX workflows. The workflows are static, so they are collected only once."""
+    return tuple(Workflows.all().tasks())
+
+
+def _workflow_tasks() -> list[Task]:
+    """Get a copy of the tasks of all the DQX workflows, so that callers never share the task instances."""
+    return [copy.deepcopy(task) for task in _workflow_task_definitions()]
+
+
+@functools.cache
+def _dashboard_folders() -> tuple[Path, ...]:
+    """Get the dashboard folders from the queries subfolders.
+
+    The queries are shipped with the package and do not change at runtime, so the folders are looked up only once.
+    """
+    queries_folder = find_project_root(__file__) / "src/databricks/labs/dqx/queries"
+
+    logger.debug(f"DQ Dashboard Query Folder is {queries_folder}")
+    dashboard_folders = []
+    # scandir entries reuse the file type read with the directory listing, instead of a stat call per entry
+    with os.scandir(queries_folder) as step_entries:
+        for step_entry in step_entries:
+            if not step_entry.is_dir():
+                continue
+            logger.debug(f"Reading step folder {step_entry.path}...")
+            with os.scandir(step_entry.path) as dashboard_entries:
+                dashboard_folders.extend(Path(entry.path) for entry in dashboard_entries if entry.is_dir())
+    return tuple(dashboard_folders)
 
 
 class WorkspaceInstaller(WorkspaceContext):
@@ -64,16 +103,16 @@ class WorkspaceInstaller(WorkspaceContext):
 
     def __init__(self, ws: WorkspaceClient, environ: dict[str, str] | None = None):
         super().__init__(ws)
-        if not environ:
-            environ = dict(os.environ.items())
+        # only a couple of variables are read, so the process environment is used as is instead of being copied
+        env: Mapping[str, str] = environ or os.environ
 
-        self._force_install = environ.get("DQX_FORCE_INSTALL")
+        self._force_install = env.get("DQX_FORCE_INSTALL")
 
-        if "DATABRICKS_RUNTIME_VERSION" in environ:
+        if "DATABRICKS_RUNTIME_VERSION" in env:
             msg = "WorkspaceInstaller is not supposed to be executed in Databricks Runtime"
             raise SystemExit(msg)
 
-        self._tasks = Workflows.all().tasks()
+        self._tasks = _workflow_tasks()
 
     @cached_property
     def upgrades(self):
@@ -133,6 +172,7 @@ class WorkspaceInstaller(WorkspaceContext):
                 workflows_deployment,
                 self.prompts,
                 self.product_info,
+                force_install=bool(self._force_install),
             )
             workspace_installation.run()
         except ManyError as err:
@@ -156,7 +196,7 @@ class WorkspaceInstaller(WorkspaceContext):
         :param version_string: The version string to extract from.
         :return: The major.minor version as a string, or None if not found.
         """
-        match = re.search(r"(\d+\.\d+)", version_string)
+        match = _MAJOR_MINOR_VERSION.search(version_string)
         if match:
             return match.group(1)
         return None
@@ -166,6 +206,8 @@ class WorkspaceInstaller(WorkspaceContext):
 
     def _prompt_for_new_installation(self) -> WorkspaceConfig:
         logger.info("Please answer a couple of questions to configure DQX")
+        # start listing the warehouses while the user answers the questions, the listing is needed at the end
+        _ = self._warehouses
         log_level = self.prompts.question("Log level", default="INFO").upper()
 
         input_location = self.prompts.question(
@@ -296,6 +338,8 @@ class WorkspaceInstaller(WorkspaceContext):
     def open_config_in_browser(self, config):
         ws_file_url = self.installation.workspace_link(config.__file__)
         if self.prompts.confirm(f"Open config file in the browser and continue installing? {ws_file_url}"):
+            import webbrowser  # pylint: disable=import-outside-toplevel
+
             webbrowser.open(ws_file_url)
 
     def replace_config(self, **changes: Any) -> WorkspaceConfig | None:
@@ -311,13 +355,25 @@ class WorkspaceInstaller(WorkspaceContext):
             new_config = None
         return new_config
 
+    @cached_property
+    def _warehouses(self) -> Future[list[EndpointInfo]]:
+        """
+        Lists the SQL warehouses in the background, starting on first access, and memoizes the listing.
+
+        :return: A future with the list of SQL warehouses.
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dqx-warehouses")
+        warehouses = executor.submit(lambda: list(self.workspace_client.warehouses.list()))
+        executor.shutdown(wait=False)  # the worker thread exits once the listing is done
+        return warehouses
+
     def configure_warehouse(self) -> str:
         def warehouse_type(_):
             return _.warehouse_type.value if not _.enable_serverless_compute else "SERVERLESS"
 
         pro_warehouses = {" [Create new PRO or SERVERLESS SQL warehouse ] ": "create_new"} | {
             f"{_.name} ({_.id}, {warehouse_type(_)}, {_.state.value})": _.id
-            for _ in self.workspace_client.warehouses.list()
+            for _ in self._warehouses.result()
             if _.warehouse_type == EndpointInfoWarehouseType.PRO
         }
 
@@ -326,7 +382,7 @@ class WorkspaceInstaller(WorkspaceContext):
         )
         if warehouse_id == "create_new":
             new_warehouse = self.workspace_client.warehouses.create(
-                name=f"{WAREHOUSE_PREFIX} {time.time_ns()}",
+                name=f"{WAREHOUSE_PREFIX} {uuid.uuid4().hex[:8]}",
                 spot_instance_policy=SpotInstancePolicy.COST_OPTIMIZED,
                 warehouse_type=CreateWarehouseRequestWarehouseType.PRO,
                 cluster_size="Small",
@@ -346,6 +402,7 @@ class WorkspaceInstallation:
         workflows_installer: WorkflowsDeployment,
         prompts: Prompts,
         product_info: ProductInfo,
+        force_install: bool = False,
     ):
         self._config = config
         self._installation = installation
@@ -354,6 +411,7 @@ class WorkspaceInstallation:
         self._ws = ws
         self._prompts = prompts
         self._product_info = product_info
+        self._force_install = force_install
         self._wheels = product_info.wheels(ws)
 
     @classmethod
@@ -371,7 +429,7 @@ class WorkspaceInstallation:
         run_config_name = config.get_run_config().name
         prompts = Prompts()
         wheels = product_info.wheels(ws)
-        tasks = Workflows.all().tasks()
+        tasks = _workflow_tasks()
         workflows_installer = WorkflowsDeployment(
             config, run_config_name, installation, install_state, ws, wheels, product_info, tasks
         )
@@ -419,40 +477,81 @@ class WorkspaceInstallation:
         :return: True if the installation finished successfully, False otherwise.
         """
         logger.info(f"Installing DQX v{self._product_info.version()}")
-        install_tasks = [self._workflows_installer.create_jobs, self._create_dq_dashboard]
+        # jobs and every dashboard are installed by a single pool, so that all their API calls overlap
+        install_tasks: list[Callable[[], None]] = [self._workflows_installer.create_jobs]
+        dashboards_digest = self._dashboards_digest()
+        if self._force_install or self._install_state.other.get("dashboards_digest") != dashboards_digest:
+            install_tasks.extend(self._get_create_dq_dashboard_tasks())
+        else:
+            logger.info("Dashboards sources are unchanged, only installing the missing dashboards")
+            install_tasks.extend(self._get_restore_dq_dashboard_tasks())
         Threads.strict("installing components", install_tasks)
+        self._install_state.other["dashboards_digest"] = dashboards_digest
+        self._install_state.save()
         logger.info("Installation completed successfully!")
 
         return True
 
-    def _create_dq_dashboard(self) -> None:
-        Threads.strict("Installing dashboards", list(self._get_create_dq_dashboard_tasks()))
+    def _dashboards_digest(self) -> str:
+        """Computes a digest of everything the dashboards are created from: the packaged dashboard files,
+        the product version, the quarantine table and the warehouse used by the dashboards.
+        """
+        run_config = self.config.get_run_config()
+        digest = hashlib.blake2b(digest_size=16)
+        for value in (self._product_info.version(), run_config.quarantine_table, run_config.warehouse_id):
+            digest.update(f"{value}\0".encode("utf-8"))
+        for folder in _dashboard_folders():
+            for file in sorted(path for path in folder.iterdir() if path.is_file()):
+                digest.update(f"{folder.parent.name}/{folder.name}/{file.name}\0".encode("utf-8"))
+                digest.update(file.read_bytes())
+        return digest.hexdigest()
+
+    def _dashboard_exists(self, dashboard_id: str) -> bool:
+        """Checks if the dashboard exists in the workspace and is not trashed"""
+        try:
+            lifecycle_state = self._ws.lakeview.get(dashboard_id).lifecycle_state
+        except (NotFound, InvalidParameterValue):
+            return False
+        return lifecycle_state not in (None, LifecycleState.TRASHED)
+
+    @staticmethod
+    def _dashboard_reference(folder: Path) -> str:
+        return f"{folder.parent.stem}_{folder.stem}".lower()
 
     def _get_create_dq_dashboard_tasks(self) -> Iterable[Callable[[], None]]:
         """Get the tasks to create Lakeview dashboards from the SQL queries in the queries subfolders"""
 
         logger.info("Creating dashboards...")
+        dashboard_folder_remote = self._create_dashboard_folder()
+        for dashboard_folder in _dashboard_folders():
+            task = functools.partial(
+                self._create_dashboard,
+                dashboard_folder,
+                parent_path=dashboard_folder_remote,
+            )
+            yield task
+
+    def _get_restore_dq_dashboard_tasks(self) -> Iterable[Callable[[], None]]:
+        """Get the tasks to create again the dashboards that were removed from the workspace, each task checks
+        its own dashboard so that the checks run in parallel"""
+        for dashboard_folder in _dashboard_folders():
+            yield functools.partial(self._restore_dashboard, dashboard_folder)
+
+    def _restore_dashboard(self, folder: Path) -> None:
+        """Create the dashboard of the given folder if it is missing or trashed in the workspace"""
+        dashboard_id = self._install_state.dashboards.get(self._dashboard_reference(folder))
+        if dashboard_id is not None and self._dashboard_exists(dashboard_id):
+            logger.debug(f"Dashboard {folder.name} is up to date, skipping its installation")
+            return
+        self._create_dashboard(folder, parent_path=self._create_dashboard_folder())
+
+    def _create_dashboard_folder(self) -> str:
         dashboard_folder_remote = f"{self._installation.install_folder()}/dashboards"
         try:
             self._ws.workspace.mkdirs(dashboard_folder_remote)
         except ResourceAlreadyExists:
             pass
-        queries_folder = find_project_root(__file__) / "src/databricks/labs/dqx/queries"
-
-        logger.debug(f"DQ Dashboard Query Folder is {queries_folder}")
-        for step_folder in queries_folder.iterdir():
-            if not step_folder.is_dir():
-                continue
-            logger.debug(f"Reading step folder {step_folder}...")
-            for dashboard_folder in step_folder.iterdir():
-                if not dashboard_folder.is_dir():
-                    continue
-                task = functools.partial(
-                    self._create_dashboard,
-                    dashboard_folder,
-                    parent_path=dashboard_folder_remote,
-                )
-                yield task
+        return dashboard_folder_remote
 
     def _handle_existing_dashboard(self, dashboard_id: str, display_name: str, parent_path: str) -> str | None:
         """Handle an existing dashboard
@@ -485,22 +584,22 @@ class WorkspaceInstallation:
         return dashboard_id  # Update the existing dashboard
 
     @staticmethod
-    def _resolve_table_name_in_queries(src_tbl_name: str, replaced_tbl_name: str, folder: Path) -> bool:
-        """Replaces table name variable in all .sql files
-        This method iterate through the dashboard folder, and replaces fully qualified tables in *.sql files
+    def _render_queries(src_tbl_name: str, replaced_tbl_name: str, folder: Path, target_folder: Path) -> bool:
+        """Renders the dashboard folder into the target folder, replacing the table name variable in all .sql files
+        This method copies the dashboard folder, and replaces fully qualified tables in *.sql files of the copy,
+        leaving the original queries untouched.
 
         Returns
             True : If the variable name is replaced across .sql files, otherwise False
         """
         logger.debug("Preparing .sql files for DQX Dashboard")
-        dyn_sql_files = glob.glob(os.path.join(folder, "*.sql"))
         try:
-            for sql_file in dyn_sql_files:
-                sql_file_path = Path(sql_file)
+            shutil.copytree(folder, target_folder, ignore=shutil.ignore_patterns("*.sql"), dirs_exist_ok=True)
+            for sql_file_path in folder.glob("*.sql"):
                 dq_sql_query = sql_file_path.read_text(encoding="utf-8")
                 dq_sql_query_ref = dq_sql_query.replace(src_tbl_name, replaced_tbl_name)
-                logger.debug(dq_sql_query_ref)
-                sql_file_path.write_text(dq_sql_query_ref, encoding="utf-8")
+                logger.debug(f"Rendered {sql_file_path.name} ({len(dq_sql_query_ref)} characters)")
+                (target_folder / sql_file_path.name).write_text(dq_sql_query_ref, encoding="utf-8")
             return True
         except Exception as e:
             err_msg = f"Error during parsing input table name into .sql files: {e}"
@@ -514,18 +613,27 @@ class WorkspaceInstallation:
     @retried(on=[InternalError, DeadlineExceeded], timeout=timedelta(minutes=4))
     def _create_dashboard(self, folder: Path, *, parent_path: str) -> None:
         """Create a lakeview dashboard from the SQL queries in the folder"""
+        # lsql is only needed for the dashboards, so it is not imported by the other installer commands
+        from databricks.labs.lsql.dashboards import (  # pylint: disable=import-outside-toplevel
+            DashboardMetadata,
+            Dashboards,
+        )
+
         logger.info(f"Reading dashboard assests from {folder}...")
 
         run_config = self.config.get_run_config()
         dq_table = run_config.quarantine_table.lower()
         logger.info(f"Using '{dq_table}' as default quarantine table for the dashboard...")
-        src_table_name = "$catalog.schema.table"
-        if self._resolve_table_name_in_queries(src_tbl_name=src_table_name, replaced_tbl_name=dq_table, folder=folder):
-            metadata = DashboardMetadata.from_path(folder)
+        # queries are rendered into a temporary copy of the folder, so that the packaged queries are never modified
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            rendered_folder = Path(tmp_dir) / folder.name
+            if not self._render_queries(QUERIES_TABLE_PLACEHOLDER, dq_table, folder, rendered_folder):
+                return
+            metadata = DashboardMetadata.from_path(rendered_folder)
             logger.debug(f"Dashboard Metadata retrieved is {metadata}")
 
             metadata.display_name = f"DQX_{folder.parent.stem.title()}_{folder.stem.title()}"
-            reference = f"{folder.parent.stem}_{folder.stem}".lower()
+            reference = self._dashboard_reference(folder)
             dashboard_id = self._install_state.dashboards.get(reference)
             logger.debug(f"dashboard id retrieved is {dashboard_id}")
 
@@ -542,9 +650,6 @@ class WorkspaceInstallation:
             assert dashboard.dashboard_id is not None
             self._install_state.dashboards[reference] = dashboard.dashboard_id
 
-        # Revert Back SQL queries to placeholder format
-        self._resolve_table_name_in_queries(src_tbl_name=dq_table, replaced_tbl_name=src_table_name, folder=folder)
-
     def uninstall(self):
         """
         Uninstalls DQX from the workspace, including project folder, dashboards, and jobs.
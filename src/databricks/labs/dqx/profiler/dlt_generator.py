@@ -108,19 +108,20 @@ class DQDltGenerator(DQEngineBase):
         :return: A dict representing the DLT rules in Python.
         """
         expectations = {}
+        get_check = self._checks_mapping.get
         for rule in rules or []:
             rule_name = rule.name
             col_name = rule.column
             params = rule.parameters or {}
-            function_mapping = self._checks_mapping
-            if rule_name not in function_mapping:
+            check = get_check(rule_name)
+            if check is None:
                 logger.info(f"No rule '{rule_name}' for column '{col_name}'. skipping...")
                 continue
-            expr = function_mapping[rule_name](col_name, **params)
+            expr = check(col_name, **params)
             if expr == "":
                 logger.info("Empty expression was generated for rule '{nm}' for column '{cl}'")
                 continue
-            exp_name = re.sub(__name_sanitize_re__, "_", f"{col_name}_{rule_name}")
+            exp_name = __name_sanitize_re__.sub("_", f"{col_name}_{rule_name}")
             expectations[exp_name] = expr
 
         return expectations
@@ -159,25 +160,26 @@ class DQDltGenerator(DQEngineBase):
         :return: A list of DLT rules.
         :raises ValueError: If the specified language is not supported.
         """
-        dlt_rules = []
+        dlt_rules: list[str] = []
+        add_rule = dlt_rules.append
         act_str = ""
         if action == "drop":
             act_str = " ON VIOLATION DROP ROW"
         elif action == "fail":
             act_str = " ON VIOLATION FAIL UPDATE"
+        get_check = self._checks_mapping.get
         for rule in rules or []:
             rule_name = rule.name
             col_name = rule.column
             params = rule.parameters or {}
-            function_mapping = self._checks_mapping
-            if rule_name not in function_mapping:
+            check = get_check(rule_name)
+            if check is None:
                 logger.info(f"No rule '{rule_name}' for column '{col_name}'. skipping...")
                 continue
-            expr = function_mapping[rule_name](col_name, **params)
+            expr = check(col_name, **params)
             if expr == "":
                 logger.info("Empty expression was generated for rule '{nm}' for column '{cl}'")
                 continue
-            dlt_rule = f"CONSTRAINT {col_name}_{rule_name} EXPECT ({expr}){act_str}"
-            dlt_rules.append(dlt_rule)
+            add_rule(f"CONSTRAINT {col_name}_{rule_name} EXPECT ({expr}){act_str}")
 
         return dlt_rules
@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import functools
 import math
 import logging
 from dataclasses import dataclass
@@ -8,12 +9,42 @@ from typing import Any
 
 import pyspark.sql.functions as F
 import pyspark.sql.types as T
-from pyspark.sql import DataFrame
+from pyspark.sql import Column, DataFrame
 
 from databricks.labs.dqx.base import DQEngineBase
 
 logger = logging.getLogger(__name__)
 
+# the estimated distinct count can be off by a few percents, the exact distinct values are collected below this margin
+_APPROX_COUNT_DISTINCT_MARGIN = 2
+# percentiles and accuracy of the summary metrics, same as the defaults of `DataFrame.summary`
+_SUMMARY_PERCENTILES = {"25%": 0.25, "50%": 0.5, "75%": 0.75}
+_SUMMARY_PERCENTILE_ACCURACY = 10000
+# data types are checked by class, so that no type instance is created for every comparison
+_SUMMARY_TYPES = (T.NumericType, T.StringType)
+_DISTINCT_TYPES = (T.StringType, T.IntegerType, T.LongType)
+_MIN_MAX_TYPES = (T.NumericType, T.DateType, T.TimestampType)
+
+
+@functools.lru_cache(maxsize=256)
+def _flatten_struct(col_name: str, schema: T.StructType) -> tuple[T.StructField, ...]:
+    """
+    Flattens a nested StructType schema into its leaf fields, prefixed with the given column name.
+    The result is cached, as the same schemas are flattened every time the same data is profiled.
+
+    :param col_name: The prefix to add to each field name.
+    :param schema: The StructType schema to flatten, data types are hashable.
+    :return: A tuple of StructField objects with prefixed names.
+    """
+    fields: list[T.StructField] = []
+    for f in schema.fields:
+        if isinstance(f.dataType, T.StructType):
+            fields.extend(_flatten_struct(f.name, f.dataType))
+        else:
+            fields.append(f)
+
+    return tuple(T.StructField(f"{col_name}.{f.name}", f.dataType, f.nullable) for f in fields)
+
 
 @dataclass
 class DQProfile:
@@ -37,6 +68,8 @@ class DQProfiler(DQEngineBase):
         "num_sigmas": 3,  # number of sigmas to use when remove_outliers is True
         "trim_strings": True,  # trim whitespace from strings
         "max_empty_ratio": 0.01,
+        "sample_fraction": None,  # fraction of rows to profile, e.g. 0.1 for 10%; profile all rows if not set
+        "sample_seed": None,  # seed for the sampling to make it reproducible
     }
 
     @staticmethod
@@ -71,69 +104,147 @@ class DQProfiler(DQEngineBase):
         """
         if opts is None:
             opts = {}
+        opts = {**self.default_profile_options, **opts}
         dq_rules: list[DQProfile] = []
 
         if not cols:
             cols = df.columns
         df_cols = [f for f in df.schema.fields if f.name in cols]
-        df = df.select(*[f.name for f in df_cols])
+        df = self._sample(df.select(*[f.name for f in df_cols]), opts)
 
-        total_count = df.count()
-        summary_stats = self._get_df_summary_as_dict(df)
+        trim_strings = opts.get("trim_strings", True)
+        summary_fields = [f for f in df_cols if isinstance(f.dataType, _SUMMARY_TYPES)]
+        fields = self.get_columns_or_fields(df_cols)
+        values = [self._get_profiled_value(field, trim_strings) for field in fields]
+
+        # the row count, the summary and the profile of all the columns are computed by a single job
+        aggregates = self._aggregate(
+            df,
+            [
+                {"count": F.count(F.lit(1))},
+                *[self._get_summary_aggregations(f) for f in summary_fields],
+                *[self._get_aggregations(f.name, value, f.dataType, opts) for f, value in zip(fields, values)],
+            ],
+        )
+        total_count = aggregates[0]["count"]
+        summary_aggregates = aggregates[1 : len(summary_fields) + 1]
+        fields_aggregates = aggregates[len(summary_fields) + 1 :]
+        summary_stats = {
+            f.name: self._to_summary_metrics(a, f.dataType) for f, a in zip(summary_fields, summary_aggregates)
+        }
         if total_count == 0:
             return summary_stats, dq_rules
 
-        opts = {**self.default_profile_options, **opts}
-        max_nulls = opts.get("max_null_ratio", 0)
-        trim_strings = opts.get("trim_strings", True)
-
-        self._profile(df, df_cols, dq_rules, max_nulls, opts, summary_stats, total_count, trim_strings)
+        self._profile(df, fields, values, fields_aggregates, dq_rules, opts, summary_stats, total_count)
 
         return summary_stats, dq_rules
 
-    def _profile(self, df, df_cols, dq_rules, max_nulls, opts, summary_stats, total_count, trim_strings):
-        # TODO: think, how we can do it in fewer passes. Maybe only for specific things, like, min_max, etc.
-        for field in self.get_columns_or_fields(df_cols):
+    @staticmethod
+    def _sample(df: DataFrame, opts: dict[str, Any]) -> DataFrame:
+        """
+        Samples the DataFrame if a sample fraction is provided in the options.
+        Unlike `limit`, sampling is distributed across all partitions of the input and gives a representative subset.
+
+        :param df: The DataFrame to sample.
+        :param opts: A dictionary of options, including the sample fraction and seed.
+        :return: The sampled DataFrame, or the original DataFrame if sampling is not enabled.
+        """
+        sample_fraction = opts.get("sample_fraction")
+        if not sample_fraction:
+            return df
+        return df.sample(fraction=sample_fraction, seed=opts.get("sample_seed"))
+
+    def _profile(self, df, fields, values, fields_aggregates, dq_rules, opts, summary_stats, total_count):
+        distinct_values = self._get_distinct_values(df, fields, values, fields_aggregates, opts, total_count)
+        for index, (field, aggregates) in enumerate(zip(fields, fields_aggregates)):
             field_name = field.name
-            typ = field.dataType
             if field_name not in summary_stats:
                 summary_stats[field_name] = {}
             metrics = summary_stats[field_name]
 
-            self._calculate_metrics(df, dq_rules, field_name, max_nulls, metrics, opts, total_count, trim_strings, typ)
+            self._calculate_metrics(
+                dq_rules, field_name, metrics, opts, total_count, field.dataType, aggregates, distinct_values.get(index)
+            )
 
-    def _calculate_metrics(
+    @staticmethod
+    def _get_profiled_value(field: T.StructField, trim_strings: bool) -> Column:
+        """
+        Gets the column expression to profile for the given field.
+
+        :param field: The field to profile.
+        :param trim_strings: Whether to trim whitespace from string values.
+        :return: The column expression, trimmed for strings if required.
+        """
+        value = F.col(field.name)
+        if isinstance(field.dataType, T.StringType) and trim_strings:
+            value = F.trim(value)
+        return value
+
+    def _get_distinct_values(
         self,
         df: DataFrame,
+        fields: list[T.StructField],
+        values: list[Column],
+        fields_aggregates: list[dict[str, Any]],
+        opts: dict[str, Any],
+        total_count: int,
+    ) -> dict[int, list[Any]]:
+        """
+        Collects the distinct values of the columns that could get an `is_in` rule, using a single job for all of them.
+
+        :param df: The DataFrame to profile.
+        :param fields: The fields to profile.
+        :param values: The column expressions to profile, one per field.
+        :param fields_aggregates: The aggregates computed for each field, see `_get_aggregations`.
+        :param opts: A dictionary of options for metric calculation.
+        :param total_count: The total number of rows in the DataFrame.
+        :return: A dictionary with the distinct values, keyed by the index of the field.
+        """
+        max_distinct = min(total_count * opts["distinct_ratio"], opts["max_in_count"])
+        # the exact distinct values are only collected if the estimate is close enough to the allowed count
+        candidates = [
+            index
+            for index, (field, aggregates) in enumerate(zip(fields, fields_aggregates))
+            if self._type_supports_distinct(field.dataType)
+            and 0 < aggregates["approx_count_distinct"] < max_distinct * _APPROX_COUNT_DISTINCT_MARGIN
+        ]
+        if not candidates:
+            return {}
+
+        # no more than `max_in_count` values are needed to tell if a column has fewer distinct values than allowed
+        max_in_count = opts["max_in_count"]
+        distinct_values = [F.slice(F.collect_set(values[i]), 1, max_in_count).alias(str(i)) for i in candidates]
+        row = df.agg(*distinct_values).collect()[0]
+        return {index: list(row[str(index)]) for index in candidates}
+
+    def _calculate_metrics(
+        self,
         dq_rules: list[DQProfile],
         field_name: str,
-        max_nulls: float,
         metrics: dict[str, Any],
         opts: dict[str, Any],
         total_count: int,
-        trim_strings: bool,
         typ: T.DataType,
+        aggregates: dict[str, Any],
+        distinct_values: list[Any] | None,
     ):
         """
         Calculates various metrics for a given DataFrame column and updates the data quality rules.
 
-        :param df: The DataFrame containing the data.
         :param dq_rules: A list to store the generated data quality rules.
         :param field_name: The name of the column to calculate metrics for.
-        :param max_nulls: The maximum allowed ratio of null values.
         :param metrics: A dictionary to store the calculated metrics.
         :param opts: A dictionary of options for metric calculation.
         :param total_count: The total number of rows in the DataFrame.
-        :param trim_strings: Whether to trim whitespace from string values.
         :param typ: The data type of the column.
+        :param aggregates: The aggregates computed for the column, see `_get_aggregations`.
+        :param distinct_values: The distinct values of the column, or None if they were not collected.
         """
-        dst = df.select(field_name).dropna()
-        if typ == T.StringType() and trim_strings:
-            col_name = dst.columns[0]
-            dst = dst.select(F.trim(F.col(col_name)).alias(col_name))
+        max_nulls = opts.get("max_null_ratio", 0)
+        trim_strings = opts.get("trim_strings", True)
 
         metrics["count"] = total_count
-        count_non_null = dst.count()
+        count_non_null = aggregates["count_non_null"]
         metrics["count_non_null"] = count_non_null
         metrics["count_null"] = total_count - count_non_null
         if count_non_null >= (total_count * (1 - max_nulls)):
@@ -149,79 +260,164 @@ class DQProfiler(DQEngineBase):
                 )
             else:
                 dq_rules.append(DQProfile(name="is_not_null", column=field_name))
-        if self._type_supports_distinct(typ):
-            dst2 = dst.dropDuplicates()
-            cnt = dst2.count()
+        if distinct_values is not None:
+            cnt = len(distinct_values)
             if 0 < cnt < total_count * opts["distinct_ratio"] and cnt < opts["max_in_count"]:
-                dq_rules.append(
-                    DQProfile(name="is_in", column=field_name, parameters={"in": [row[0] for row in dst2.collect()]})
-                )
+                dq_rules.append(DQProfile(name="is_in", column=field_name, parameters={"in": distinct_values}))
         if (
-            typ == T.StringType()
+            isinstance(typ, T.StringType)
             and not any(  # does not make sense to add is_not_null_or_empty if is_not_null already exists
                 rule.name == "is_not_null" and rule.column == field_name for rule in dq_rules
             )
         ):
-            dst2 = dst.filter(F.col(field_name) == "")
-            cnt = dst2.count()
+            cnt = aggregates["count_empty"]
             if cnt <= (metrics["count"] * opts.get("max_empty_ratio", 0)):
                 dq_rules.append(
                     DQProfile(name="is_not_null_or_empty", column=field_name, parameters={"trim_strings": trim_strings})
                 )
         if metrics["count_non_null"] > 0 and self._type_supports_min_max(typ):
-            rule = self._extract_min_max(dst, field_name, typ, metrics, opts)
+            rule = self._extract_min_max(aggregates, field_name, typ, metrics, opts)
             if rule:
                 dq_rules.append(rule)
 
-    def _get_df_summary_as_dict(self, df: DataFrame) -> dict[str, Any]:
+    def _get_aggregations(
+        self, field_name: str, value: Column, typ: T.DataType, opts: dict[str, Any]
+    ) -> dict[str, Column]:
         """
-        Generate summary for DataFrame and return it as a dictionary with column name as a key, and dict of metric/value.
+        Builds the aggregations required to profile a column, so that they can be computed in a single pass.
 
-        :param df: The DataFrame to profile.
-        :return: A dictionary with metrics per column.
-        """
-        sm_dict: dict[str, dict] = {}
-        field_types = {f.name: f.dataType for f in df.schema.fields}
-        for row in df.summary().collect():
-            row_dict = row.asDict()
-            metric = row_dict["summary"]
-            self._process_row(row_dict, metric, sm_dict, field_types)
-        return sm_dict
-
-    def _process_row(self, row_dict: dict, metric: str, sm_dict: dict, field_types: dict):
-        """
-        Processes a row from the DataFrame summary and updates the summary dictionary.
-
-        :param row_dict: A dictionary representing a row from the DataFrame summary.
-        :param metric: The metric name (e.g., "mean", "stddev") for the current row.
-        :param sm_dict: The summary dictionary to update with the processed metrics.
-        :param field_types: A dictionary mapping column names to their data types.
-        """
-        for metric_name, metric_value in row_dict.items():
-            if metric_name == "summary":
-                continue
-            if metric_name not in sm_dict:
-                sm_dict[metric_name] = {}
-            self._process_metric(metric_name, metric_value, metric, sm_dict, field_types)
-
-    def _process_metric(self, metric_name: str, metric_value: Any, metric: str, sm_dict: dict, field_types: dict):
-        """
-        Processes a metric value and updates the summary dictionary with the casted value.
-
-        :param metric_name: The name of the metric (e.g., column name).
-        :param metric_value: The value of the metric to process.
-        :param metric: The type of metric (e.g., "stddev", "mean").
-        :param sm_dict: The summary dictionary to update with the processed metric.
-        :param field_types: A dictionary mapping column names to their data types.
-        """
-        typ = field_types[metric_name]
-        if metric_value is not None:
-            if metric in {"stddev", "mean"}:
-                sm_dict[metric_name][metric] = float(metric_value)
+        :param field_name: The name of the column to profile.
+        :param value: The column expression to profile, e.g. the trimmed column for strings.
+        :param typ: The data type of the column.
+        :param opts: A dictionary of options for metric calculation.
+        :return: A dictionary with the aggregate columns, keyed by the name of the metric they compute.
+        """
+        aggregations = {"count_non_null": F.count(value)}
+        if isinstance(typ, T.StringType):
+            aggregations["count_empty"] = F.count(F.when(value == "", True))
+        if self._type_supports_distinct(typ):
+            aggregations["approx_count_distinct"] = F.approx_count_distinct(value)
+        if not self._type_supports_min_max(typ):
+            return aggregations
+
+        remove_outliers = self._should_remove_outliers(field_name, opts)
+        if remove_outliers:
+            if isinstance(typ, T.DateType):
+                value = value.cast("timestamp").cast("bigint")
+            elif isinstance(typ, T.TimestampType):
+                value = value.cast("bigint")
+            aggregations["mean"] = F.mean(value)
+            aggregations["stddev"] = F.stddev(value)
+        aggregations["min"] = F.min(value)
+        aggregations["max"] = F.max(value)
+        if isinstance(typ, T.TimestampType) and not remove_outliers:
+            aggregations["min"] = F.date_format(aggregations["min"], "yyyy-MM-dd HH:mm:ss")
+            aggregations["max"] = F.date_format(aggregations["max"], "yyyy-MM-dd HH:mm:ss")
+        return aggregations
+
+    @staticmethod
+    def _should_remove_outliers(col_name: str, opts: dict[str, Any]) -> bool:
+        """
+        Checks if the outliers should be removed from the min/max limits of the column.
+
+        :param col_name: The name of the column.
+        :param opts: A dictionary of options for rule generation.
+        :return: True if the outliers should be removed, False otherwise.
+        """
+        outlier_cols = opts.get("outlier_columns", [])
+        return bool(opts.get("remove_outliers", True)) and (len(outlier_cols) == 0 or col_name in outlier_cols)
+
+    @staticmethod
+    def _get_summary_aggregations(field: T.StructField) -> dict[str, Column]:
+        """
+        Builds the aggregations of the summary metrics of a column. The summary has the same metrics as
+        `DataFrame.summary`, computed the same way and returned as strings, but along the other aggregations.
+
+        :param field: The field to summarize, either numeric or string.
+        :return: A dictionary with the aggregate columns, keyed by the name of the metric they compute.
+        """
+        column = F.col(field.name)
+        return {
+            "count": F.count(column).cast("string"),
+            "mean": F.mean(column).cast("string"),
+            "stddev": F.stddev(column).cast("string"),
+            "min": F.min(column).cast("string"),
+            "percentiles": F.percentile_approx(
+                column, list(_SUMMARY_PERCENTILES.values()), _SUMMARY_PERCENTILE_ACCURACY
+            ).cast("array<string>"),
+            "max": F.max(column).cast("string"),
+        }
+
+    @classmethod
+    def _to_summary_metrics(cls, aggregates: dict[str, Any], typ: T.DataType) -> dict[str, Any]:
+        """
+        Converts the summary aggregates of a column into its summary metrics, in the order of `DataFrame.summary`.
+        Like for `DataFrame.summary`, mean and stddev are floats, and the other metrics are cast to the column type.
+
+        :param aggregates: The aggregates computed for the column, see `_get_summary_aggregations`.
+        :param typ: The data type of the column.
+        :return: A dictionary of metric/value.
+        """
+        percentiles = aggregates["percentiles"] or [None] * len(_SUMMARY_PERCENTILES)
+        values = {
+            "count": aggregates["count"],
+            "mean": aggregates["mean"],
+            "stddev": aggregates["stddev"],
+            "min": aggregates["min"],
+            **dict(zip(_SUMMARY_PERCENTILES, percentiles)),
+            "max": aggregates["max"],
+        }
+        metrics: dict[str, Any] = {}
+        for metric, value in values.items():
+            if value is None:
+                metrics[metric] = None
+            elif metric in {"stddev", "mean"}:
+                metrics[metric] = float(value)
             else:
-                sm_dict[metric_name][metric] = self._do_cast(metric_value, typ)
-        else:
-            sm_dict[metric_name][metric] = None
+                metrics[metric] = cls._do_cast(value, typ)
+        return metrics
+
+    @staticmethod
+    def _do_cast(value: str | None, typ: T.DataType) -> Any | None:
+        """
+        Casts a string value to a specified PySpark data type.
+
+        :param value: The string value to cast. Can be None.
+        :param typ: The PySpark data type to cast the value to.
+        :return: The casted value, or None if the input value is None.
+        """
+        if not value:
+            return None
+        if isinstance(typ, T.IntegralType):
+            return int(value)
+        if typ == T.DoubleType() or typ == T.FloatType():
+            return float(value)
+        if isinstance(typ, T.DecimalType):
+            context = Context(prec=typ.precision)
+            return Decimal(value, context)
+        if typ == T.StringType():
+            return value
+
+        raise ValueError(f"Unsupported data type for casting: {typ}")
+
+    @staticmethod
+    def _aggregate(df: DataFrame, aggregations: list[dict[str, Column]]) -> list[dict[str, Any]]:
+        """
+        Computes the aggregations of several columns in a single job.
+
+        :param df: The DataFrame to aggregate.
+        :param aggregations: The aggregate columns of each column, keyed by the name of the metric they compute.
+        :return: The computed aggregates of each column, keyed by the name of the metric.
+        """
+        # the metrics are suffixed with the index of their column, as several columns compute the same metrics
+        aliased_aggregations = [
+            aggregation.alias(f"{metric}_{index}")
+            for index, column_aggregations in enumerate(aggregations)
+            for metric, aggregation in column_aggregations.items()
+        ]
+        # the values of the row are in the order of the aggregations, so they are read by position
+        row_values = iter(df.agg(*aliased_aggregations).collect()[0])
+        return [{metric: next(row_values) for metric in column_aggregations} for column_aggregations in aggregations]
 
     def _round_value(self, value: Any, direction: str, opts: dict[str, Any]) -> Any:
         """
@@ -235,23 +431,14 @@ class DQProfiler(DQEngineBase):
         if not value or not opts.get("round", False):
             return value
 
-        if isinstance(value, datetime.datetime):
-            return self._round_datetime(value, direction)
-
-        if isinstance(value, float):
-            return self._round_float(value, direction)
-
-        if isinstance(value, int):
-            return value  # already rounded
-
-        if isinstance(value, decimal.Decimal):
-            return self._round_decimal(value, direction)
-
-        return value
+        round_func = self._round_funcs.get(type(value))
+        if round_func is None:
+            return value
+        return round_func(value, direction)
 
     def _extract_min_max(
         self,
-        dst: DataFrame,
+        aggregates: dict[str, Any],
         col_name: str,
         typ: T.DataType,
         metrics: dict[str, Any],
@@ -260,7 +447,7 @@ class DQProfiler(DQEngineBase):
         """
         Generates a data quality profile rule for column value ranges.
 
-        :param dst: A single-column DataFrame containing the data to analyze.
+        :param aggregates: The aggregates computed for the column, see `_get_aggregations`.
         :param col_name: The name of the column to generate the rule for.
         :param typ: The data type of the column.
         :param metrics: A dictionary to store the calculated metrics.
@@ -274,39 +461,22 @@ class DQProfiler(DQEngineBase):
         if opts is None:
             opts = {}
 
-        outlier_cols = opts.get("outlier_columns", [])
-        column = dst.columns[0]
-        if opts.get("remove_outliers", True) and (
-            len(outlier_cols) == 0 or col_name in outlier_cols
-        ):  # detect outliers
-            if typ == T.DateType():
-                dst = dst.select(F.col(column).cast("timestamp").cast("bigint").alias(column))
-            elif typ == T.TimestampType():
-                dst = dst.select(F.col(column).cast("bigint").alias(column))
-            # TODO: do summary instead? to get percentiles, etc.?
-            mn_mx = dst.agg(F.min(column), F.max(column), F.mean(column), F.stddev(column)).collect()
+        if self._should_remove_outliers(col_name, opts):  # detect outliers
             descr, max_limit, min_limit = self._get_min_max(
-                col_name, descr, max_limit, metrics, min_limit, mn_mx, opts, typ
+                col_name, descr, max_limit, metrics, min_limit, aggregates, opts, typ
             )
-        else:
-            mn_mx_df = dst.agg(F.min(column).alias('min_value'), F.max(column).alias('max_value'))
-            if typ == T.TimestampType():
-                mn_mx_df = mn_mx_df.withColumn(
-                    "min_value", F.date_format("min_value", "yyyy-MM-dd HH:mm:ss")
-                ).withColumn("max_value", F.date_format("max_value", "yyyy-MM-dd HH:mm:ss"))
-            mn_mx = mn_mx_df.collect()
-            if mn_mx and len(mn_mx) > 0:
-                if typ == T.TimestampType():
-                    metrics['min'] = datetime.datetime.strptime(mn_mx[0][0], "%Y-%m-%d %H:%M:%S")
-                    metrics['max'] = datetime.datetime.strptime(mn_mx[0][1], "%Y-%m-%d %H:%M:%S")
-                else:
-                    metrics["min"] = mn_mx[0][0]
-                    metrics["max"] = mn_mx[0][1]
-                min_limit = self._round_value(metrics.get("min"), "down", opts)
-                max_limit = self._round_value(metrics.get("max"), "up", opts)
-                descr = "Real min/max values were used"
+        elif aggregates["min"] is not None and aggregates["max"] is not None:
+            if isinstance(typ, T.TimestampType):
+                metrics['min'] = datetime.datetime.strptime(aggregates["min"], "%Y-%m-%d %H:%M:%S")
+                metrics['max'] = datetime.datetime.strptime(aggregates["max"], "%Y-%m-%d %H:%M:%S")
             else:
-                logger.info(f"Can't get min/max for field {col_name}")
+                metrics["min"] = aggregates["min"]
+                metrics["max"] = aggregates["max"]
+            min_limit = self._round_value(metrics.get("min"), "down", opts)
+            max_limit = self._round_value(metrics.get("max"), "up", opts)
+            descr = "Real min/max values were used"
+        else:
+            logger.info(f"Can't get min/max for field {col_name}")
         if descr and min_limit and max_limit:
             return DQProfile(
                 name="min_max", column=col_name, parameters={"min": min_limit, "max": max_limit}, description=descr
@@ -321,7 +491,7 @@ class DQProfiler(DQEngineBase):
         max_limit: Any | None,
         metrics: dict[str, Any],
         min_limit: Any | None,
-        mn_mx: list,
+        aggregates: dict[str, Any],
         opts: dict[str, Any],
         typ: T.DataType,
     ):
@@ -333,17 +503,18 @@ class DQProfiler(DQEngineBase):
         :param max_limit: The maximum limit for the column.
         :param metrics: A dictionary to store the calculated metrics.
         :param min_limit: The minimum limit for the column.
-        :param mn_mx: A list containing the min, max, mean, and stddev values for the column.
+        :param aggregates: A dictionary containing the min, max, mean, and stddev values for the column.
         :param opts: A dictionary of options for the min/max calculation.
         :param typ: The data type of the column.
         :return: A tuple containing the description, maximum limit, and minimum limit.
         """
-        if mn_mx and len(mn_mx) > 0:
-            metrics["min"] = mn_mx[0][0]
-            metrics["max"] = mn_mx[0][1]
+        mn, mx = aggregates["min"], aggregates["max"]
+        if mn is not None and mx is not None:
+            metrics["min"] = mn
+            metrics["max"] = mx
             sigmas = opts.get("sigmas", 3)
-            avg = mn_mx[0][2]
-            stddev = mn_mx[0][3]
+            avg = aggregates["mean"]
+            stddev = aggregates["stddev"]
 
             if avg is None or stddev is None:
                 return descr, max_limit, min_limit
@@ -354,25 +525,26 @@ class DQProfiler(DQEngineBase):
                 stddev = Decimal(stddev, context)
                 avg = Decimal(avg, context)
 
-            min_limit = avg - sigmas * stddev
-            max_limit = avg + sigmas * stddev
-            if min_limit > mn_mx[0][0] and max_limit < mn_mx[0][1]:
+            max_deviation = sigmas * stddev
+            min_limit = avg - max_deviation
+            max_limit = avg + max_deviation
+            if min_limit > mn and max_limit < mx:
                 descr = (
                     f"Range doesn't include outliers, capped by {sigmas} sigmas. avg={avg}, "
                     f"stddev={stddev}, min={metrics.get('min')}, max={metrics.get('max')}"
                 )
-            elif min_limit < mn_mx[0][0] and max_limit > mn_mx[0][1]:  #
-                min_limit = mn_mx[0][0]
-                max_limit = mn_mx[0][1]
+            elif min_limit < mn and max_limit > mx:  #
+                min_limit = mn
+                max_limit = mx
                 descr = "Real min/max values were used"
-            elif min_limit < mn_mx[0][0]:
-                min_limit = mn_mx[0][0]
+            elif min_limit < mn:
+                min_limit = mn
                 descr = (
                     f"Real min value was used. Max was capped by {sigmas} sigmas. avg={avg}, "
                     f"stddev={stddev}, max={metrics.get('max')}"
                 )
-            elif max_limit > mn_mx[0][1]:
-                max_limit = mn_mx[0][1]
+            elif max_limit > mx:
+                max_limit = mx
                 descr = (
                     f"Real max value was used. Min was capped by {sigmas} sigmas. avg={avg}, "
                     f"stddev={stddev}, min={metrics.get('min')}"
@@ -399,13 +571,13 @@ class DQProfiler(DQEngineBase):
         if isinstance(typ, T.IntegralType):
             min_limit = int(self._round_value(min_limit, "down", {"round": True}))
             max_limit = int(self._round_value(max_limit, "up", {"round": True}))
-        elif typ == T.DateType():
+        elif isinstance(typ, T.DateType):
             min_limit = datetime.date.fromtimestamp(int(min_limit))
             max_limit = datetime.date.fromtimestamp(int(max_limit))
             metrics["min"] = datetime.date.fromtimestamp(int(metrics["min"]))
             metrics["max"] = datetime.date.fromtimestamp(int(metrics["max"]))
             metrics["mean"] = datetime.date.fromtimestamp(int(avg))
-        elif typ == T.TimestampType():
+        elif isinstance(typ, T.TimestampType):
             min_limit = self._round_value(datetime.datetime.fromtimestamp(int(min_limit)), "down", {"round": True})
             max_limit = self._round_value(datetime.datetime.fromtimestamp(int(max_limit)), "up", {"round": True})
             metrics["min"] = datetime.datetime.fromtimestamp(int(metrics["min"]))
@@ -422,37 +594,7 @@ class DQProfiler(DQEngineBase):
         :param schema: The StructType schema to extract fields from.
         :return: A list of StructField objects with prefixed names.
         """
-        fields = []
-        for f in schema.fields:
-            if isinstance(f.dataType, T.StructType):
-                fields.extend(DQProfiler._get_fields(f.name, f.dataType))
-            else:
-                fields.append(f)
-
-        return [T.StructField(f"{col_name}.{f.name}", f.dataType, f.nullable) for f in fields]
-
-    @staticmethod
-    def _do_cast(value: str | None, typ: T.DataType) -> Any | None:
-        """
-        Casts a string value to a specified PySpark data type.
-
-        :param value: The string value to cast. Can be None.
-        :param typ: The PySpark data type to cast the value to.
-        :return: The casted value, or None if the input value is None.
-        """
-        if not value:
-            return None
-        if isinstance(typ, T.IntegralType):
-            return int(value)
-        if typ == T.DoubleType() or typ == T.FloatType():
-            return float(value)
-        if isinstance(typ, T.DecimalType):
-            context = Context(prec=typ.precision)
-            return Decimal(value, context)
-        if typ == T.StringType():
-            return value
-
-        raise ValueError(f"Unsupported data type for casting: {typ}")
+        return list(_flatten_struct(col_name, schema))
 
     @staticmethod
     def _type_supports_distinct(typ: T.DataType) -> bool:
@@ -462,7 +604,7 @@ class DQProfiler(DQEngineBase):
         :param typ: The PySpark data type to check.
         :return: True if the data type supports distinct operations, False otherwise.
         """
-        return typ == T.StringType() or typ == T.IntegerType() or typ == T.LongType()
+        return isinstance(typ, _DISTINCT_TYPES)
 
     @staticmethod
     def _type_supports_min_max(typ: T.DataType) -> bool:
@@ -472,7 +614,7 @@ class DQProfiler(DQEngineBase):
         :param typ: The PySpark data type to check.
         :return: True if the data type supports min and max operations, False otherwise.
         """
-        return isinstance(typ, T.NumericType) or typ == T.DateType() or typ == T.TimestampType()
+        return isinstance(typ, _MIN_MAX_TYPES)
 
     @staticmethod
     def _round_datetime(value: datetime.datetime, direction: str) -> datetime.datetime:
@@ -497,3 +639,10 @@ class DQProfiler(DQEngineBase):
         if direction == "up":
             return value.to_integral_value(rounding=decimal.ROUND_CEILING)
         return value
+
+    _round_funcs = {
+        datetime.datetime: _round_datetime,
+        float: _round_float,
+        int: lambda value, direction: value,  # already rounded
+        decimal.Decimal: _round_decimal,
+    }
@@ -1,6 +1,7 @@
 from enum import Enum
 from dataclasses import dataclass, field
 import functools as ft
+import inspect
 from typing import Any
 from collections.abc import Callable
 from datetime import datetime
@@ -16,6 +17,21 @@ class Criticality(Enum):
     ERROR = "error"
 
 
+_VALID_CRITICALITIES = frozenset(c.value for c in Criticality)
+
+
+@ft.lru_cache(maxsize=256)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Signature of a check function, introspected once per function."""
+    return inspect.signature(func)
+
+
+@ft.lru_cache(maxsize=256)
+def _cached_param_names(func: Callable) -> list[str]:
+    """Parameter names of a check function, in declaration order."""
+    return list(_cached_signature(func).parameters.keys())
+
+
 class DefaultColumnNames(Enum):
     """Enum class to represent columns in the dataframe that will be used for error and warning reporting."""
 
@@ -30,12 +46,12 @@ class ColumnArguments(Enum):
     WARNINGS = "warnings"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtraParams:
     """Class to represent extra parameters for DQEngine."""
 
     column_names: dict[str, str] = field(default_factory=dict)
-    run_time: datetime = datetime.now()
+    run_time: datetime = field(default_factory=datetime.now)
     user_metadata: dict[str, str] = field(default_factory=dict)
 
 
@@ -60,11 +76,16 @@ class DQRule:
     check_func_kwargs: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
-        # validates correct args and kwargs are passed
-        check = self._get_check()
+        # the check may be built lazily, so the arguments are copied to not see later changes made by the caller
+        object.__setattr__(self, "check_func_args", list(self.check_func_args))
+        object.__setattr__(self, "check_func_kwargs", dict(self.check_func_kwargs))
 
-        # take the name from the alias of the column expression if not provided
-        object.__setattr__(self, "name", self.name if self.name else "col_" + get_column_name(check))
+        if self.name:
+            # validates correct args and kwargs are passed, the check is only built when used
+            self._validate_args()
+        else:
+            # take the name from the alias of the column expression, the built check is kept for check_column
+            object.__setattr__(self, "name", "col_" + get_column_name(self._check_col))
 
     @ft.cached_property
     def rule_criticality(self) -> str:
@@ -74,16 +95,55 @@ class DQRule:
         :raises ValueError: if criticality is invalid.
         """
         criticality = self.criticality
-        if criticality not in {Criticality.WARN.value, Criticality.ERROR.value}:
+        if criticality not in _VALID_CRITICALITIES:
             raise ValueError(f"Invalid criticality value: {criticality}")
 
         return criticality
 
-    def _get_check(self) -> Column:
-        """Creates a Column object from the given check."""
+    @ft.cached_property
+    def _check_col(self) -> Column:
+        """Column object of the check, built once per rule."""
+        return self._get_check()
+
+    @ft.cached_property
+    def _filter_col(self) -> Column | None:
+        """Column object of the filter, parsed once per rule."""
+        return F.expr(self.filter) if self.filter else None
+
+    def _get_args(self) -> list[Any]:
+        """Positional arguments of the check function, i.e. the column name followed by the other arguments."""
         args = [self.col_name] if self.col_name else []
         args.extend(self.check_func_args)
-        return self.check_func(*args, **self.check_func_kwargs)
+        return args
+
+    def _validate_args(self):
+        """Validates the arguments of the check function against its signature, without building the check.
+
+        :raises TypeError: if the arguments don't match the signature of the check function.
+        """
+        try:
+            signature = _cached_signature(self.check_func)
+        except (TypeError, ValueError):
+            # the signature cannot be introspected (e.g. for builtins), so the check is built instead
+            _ = self._check_col
+            return
+        try:
+            signature.bind(*self._get_args(), **self.check_func_kwargs)
+        except TypeError:
+            # calling the check function reports the same error as if the check was built
+            self._get_check()
+            raise
+
+    def _get_check(self) -> Column:
+        """Creates a Column object from the given check."""
+        return self.check_func(*self._get_args(), **self.check_func_kwargs)
+
+    def filter_column(self) -> Column | None:
+        """Returns the filter condition of the rule as a Spark Column expression.
+
+        :return: A Spark Column object representing the filter, or None if the rule has no filter.
+        """
+        return self._filter_col
 
     def check_column(self) -> Column:
         """Generates a Spark Column expression representing the check.
@@ -95,10 +155,31 @@ class DQRule:
 
         :return: A Spark Column object representing the check condition.
         """
+        check = self._check_col
+        predicate = check.isNotNull()
         # if filter is provided, apply the filter to the check
-        filter_col = F.expr(self.filter) if self.filter else F.lit(True)
-        return F.when(self._get_check().isNotNull(), F.when(filter_col, self._get_check())).otherwise(
-            F.lit(None).cast("string")
+        filter_col = self.filter_column()
+        if filter_col is not None:
+            predicate = filter_col & predicate
+        return F.when(predicate, check).otherwise(F.lit(None).cast("string"))
+
+    def result_struct(self, run_time_col: Column, user_metadata_col: Column) -> Column:
+        """Generates a Spark Column expression with the result of the check, as an element of the reporting columns.
+
+        The `message` field holds the value of `check_column`, i.e. it is `null` if the check passed.
+
+        :param run_time_col: Column with the run time of the checks, shared by all the rules.
+        :param user_metadata_col: Column with the user metadata, shared by all the rules.
+        :return: A Spark Column object representing the result struct of the check.
+        """
+        return F.struct(
+            F.lit(self.name).alias("name"),
+            self.check_column().alias("message"),
+            F.lit(self.col_name).alias("col_name"),
+            (F.lit(self.filter) if self.filter else F.lit(None).cast("string")).alias("filter"),
+            F.lit(self.check_func.__name__).alias("function"),
+            run_time_col.alias("run_time"),
+            user_metadata_col.alias("user_metadata"),
         )
 
 
@@ -121,14 +202,11 @@ class DQRuleColSet:
     check_func_args: list[Any] = field(default_factory=list)
     check_func_kwargs: dict[str, Any] = field(default_factory=dict)
 
-    def get_rules(self) -> list[DQRule]:
-        """Build a list of rules for a set of columns.
-
-        :return: list of dq rules
-        """
-        rules = []
-        for col_name in self.columns:
-            rule = DQRule(
+    @ft.cached_property
+    def _rules(self) -> tuple[DQRule, ...]:
+        """Rules for the set of columns, built once per rule set."""
+        rules = tuple(
+            DQRule(
                 col_name=col_name,
                 name=self.name,
                 criticality=self.criticality,
@@ -137,11 +215,31 @@ class DQRuleColSet:
                 check_func_kwargs=self.check_func_kwargs,
                 filter=self.filter,
             )
-            rules.append(rule)
+            for col_name in self.columns
+        )
+        if self.filter:
+            # the filter is the same for all the rules of the set, so it is parsed once and shared
+            filter_col = F.expr(self.filter)
+            for rule in rules:
+                object.__setattr__(rule, "_filter_col", filter_col)
         return rules
 
+    def get_rules(self) -> list[DQRule]:
+        """Build a list of rules for a set of columns.
 
-@dataclass(frozen=True)
+        :return: list of dq rules
+        """
+        return list(self._rules)
+
+    def get_check_columns(self) -> list[tuple[str, Column]]:
+        """Build the check columns of the rules, so they can be added to a dataframe in a single projection.
+
+        :return: list of tuples of rule name and check column aliased with the rule name
+        """
+        return [(rule.name, rule.check_column().alias(rule.name)) for rule in self._rules]
+
+
+@dataclass(frozen=True, slots=True)
 class ChecksValidationStatus:
     """Class to represent the validation status."""
 
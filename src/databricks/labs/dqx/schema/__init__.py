@@ -1,3 +1,3 @@
-from .dq_result_schema import dq_result_schema
+from .dq_result_schema import dq_result_schema, dq_result_item_schema
 
-__all__ = ["dq_result_schema"]
+__all__ = ["dq_result_schema", "dq_result_item_schema"]
@@ -209,6 +209,41 @@ def test_apply_checks(ws, spark):
     assert_df_equality(checked, expected, ignore_nullable=True)
 
 
+def test_apply_checks_with_error_checks_only(ws, spark):
+    dq_engine = DQEngine(workspace_client=ws, extra_params=EXTRA_PARAMS)
+    test_df = spark.createDataFrame([[1, 3, 3], [None, 4, None]], SCHEMA)
+
+    checks = [
+        DQRule(name="col_a_is_null_or_empty", criticality="error", check_func=is_not_null_and_not_empty, col_name="a")
+    ]
+    checked = dq_engine.apply_checks(test_df, checks)
+
+    expected = spark.createDataFrame(
+        [
+            [1, 3, 3, None, None],
+            [
+                None,
+                4,
+                None,
+                [
+                    {
+                        "name": "col_a_is_null_or_empty",
+                        "message": "Column a is null or empty",
+                        "col_name": "a",
+                        "filter": None,
+                        "function": "is_not_null_and_not_empty",
+                        "run_time": RUN_TIME,
+                        "user_metadata": {},
+                    }
+                ],
+                None,
+            ],
+        ],
+        EXPECTED_SCHEMA,
+    )
+    assert_df_equality(checked, expected, ignore_nullable=True)
+
+
 def test_apply_checks_invalid_criticality(ws, spark):
     dq_engine = DQEngine(ws)
     test_df = spark.createDataFrame([[1, 3, 3], [2, None, 4], [None, 4, None], [None, None, None]], SCHEMA)
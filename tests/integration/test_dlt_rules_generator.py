@@ -1,3 +1,4 @@
+from decimal import Decimal
 import pytest
 from tests.integration.test_rules_generator import test_rules
 from databricks.labs.dqx.profiler.dlt_generator import DQDltGenerator
@@ -129,3 +130,23 @@ def test_generate_dlt_python_dict(ws):
         "d1_min_max": "d1 >= 1.23 and d1 <= 333323.00",
     }
     assert expectations == expected
+
+
+def test_generate_dlt_sql_keeps_value_types(ws):
+    generator = DQDltGenerator(ws)
+    rules = [
+        DQProfile(name="min_max", column="c", parameters={"min": 1, "max": 10}),
+        DQProfile(name="min_max", column="c", parameters={"min": 1.0, "max": 10.0}),
+        DQProfile(name="min_max", column="c", parameters={"min": Decimal("1.00"), "max": Decimal("10.00")}),
+        DQProfile(name="is_in", column="c", parameters={"in": [1.0, 2.0]}),
+        DQProfile(name="is_in", column="c", parameters={"in": [1, 2]}),
+    ]
+    expectations = generator.generate_dlt_rules(rules)
+    expected = [
+        "CONSTRAINT c_min_max EXPECT (c >= 1 and c <= 10)",
+        "CONSTRAINT c_min_max EXPECT (c >= 1.0 and c <= 10.0)",
+        "CONSTRAINT c_min_max EXPECT (c >= 1.00 and c <= 10.00)",
+        "CONSTRAINT c_is_in EXPECT (c in (1.0, 2.0))",
+        "CONSTRAINT c_is_in EXPECT (c in (1, 2))",
+    ]
+    assert expectations == expected
@@ -202,6 +202,18 @@ def test_profiler_empty_df(spark, ws):
     assert len(actual_dq_rules) == 0
 
 
+def test_profiler_with_sampling(spark, ws):
+    input_df = spark.range(1000).selectExpr("cast(id as int) as col1")
+    opts = {"sample_fraction": 0.1, "sample_seed": 42}
+
+    profiler = DQProfiler(ws)
+    stats, _ = profiler.profile(input_df, opts=opts)
+
+    expected_count = input_df.sample(fraction=0.1, seed=42).count()
+    assert stats["col1"]["count"] == expected_count
+    assert expected_count < 1000
+
+
 def test_profiler_when_numeric_field_is_empty(spark, ws):
     schema = "col1: int, col2: int, col3: int, col4 int"
     input_df = spark.createDataFrame([[1, 3, 3, 1], [2, None, 4, 1], [1, 2, 3, 4]], schema)
@@ -229,3 +241,15 @@ def test_profiler_when_numeric_field_is_empty(spark, ws):
 
     assert len(stats.keys()) > 0
     assert rules == expected_rules
+
+
+def test_profiler_generates_is_in_for_low_cardinality_columns(spark, ws):
+    input_df = spark.range(100).selectExpr("cast(id as int) as col1", "if(id % 2 = 0, 'a', 'b') as col2")
+
+    profiler = DQProfiler(ws)
+    _, rules = profiler.profile(input_df)
+
+    is_in_rules = [rule for rule in rules if rule.name == "is_in"]
+    assert [rule.column for rule in is_in_rules] == ["col2"]
+    assert is_in_rules[0].parameters is not None
+    assert sorted(is_in_rules[0].parameters["in"]) == ["a", "b"]
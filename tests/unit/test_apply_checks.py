@@ -3,7 +3,7 @@ from unittest.mock import MagicMock
 from datetime import datetime
 from chispa.dataframe_comparer import assert_df_equality  # type: ignore
 from databricks.labs.dqx.col_functions import is_not_null_and_not_empty
-from databricks.labs.dqx.engine import DQEngine, ExtraParams, DQRule
+from databricks.labs.dqx.engine import DQEngine, DQEngineCore, ExtraParams, DQRule
 from databricks.labs.dqx.schema import dq_result_schema
 from databricks.sdk import WorkspaceClient
 
@@ -58,3 +58,23 @@ def test_apply_checks(spark_local):
         expected_schema,
     )
     assert_df_equality(df, expected_df, ignore_nullable=True)
+
+
+def test_duplicate_checks_evaluated_once():
+    ws = MagicMock(spec=WorkspaceClient, **{"catalogs.list.return_value": []})
+    dq_engine = DQEngineCore(workspace_client=ws)
+
+    checks = [
+        DQRule(name="col_x_is_null_or_empty", criticality="warn", check_func=is_not_null_and_not_empty, col_name="x"),
+        DQRule(name="col_x_is_null_or_empty", criticality="warn", check_func=is_not_null_and_not_empty, col_name="x"),
+        # same name but different column
+        DQRule(name="col_x_is_null_or_empty", criticality="warn", check_func=is_not_null_and_not_empty, col_name="y"),
+        # same check but different criticality
+        DQRule(name="col_x_is_null_or_empty", criticality="error", check_func=is_not_null_and_not_empty, col_name="x"),
+    ]
+
+    error_results, warning_results = dq_engine._build_check_results(checks)
+
+    assert len(error_results) == 1
+    assert len(warning_results) == 2
+
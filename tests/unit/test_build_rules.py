@@ -1,5 +1,8 @@
+import inspect
 import pprint
 import logging
+from datetime import datetime
+from unittest.mock import patch, MagicMock
 import pytest
 
 from databricks.labs.dqx.col_functions import (
@@ -13,6 +16,7 @@ from databricks.labs.dqx.engine import (
     DQRule,
     DQRuleColSet,
     DQEngineCore,
+    ExtraParams,
 )
 
 SCHEMA = "a: int, b: int, c: int"
@@ -99,6 +103,32 @@ def test_get_rules():
     assert pprint.pformat(actual_rules) == pprint.pformat(expected_rules)
 
 
+def test_get_rules_builds_rules_once():
+    rule_set = DQRuleColSet(columns=["a", "b"], check_func=is_not_null_and_not_empty)
+
+    rules = rule_set.get_rules()
+    rules.clear()
+
+    assert [id(rule) for rule in rule_set.get_rules()] == [id(rule) for rule in rule_set.get_rules()]
+    assert len(rule_set.get_rules()) == 2
+
+
+def test_get_rules_share_filter():
+    rule_set = DQRuleColSet(columns=["a", "b"], filter="c > 0", check_func=is_not_null_and_not_empty)
+
+    first_rule, second_rule = rule_set.get_rules()
+
+    assert first_rule.filter_column() is second_rule.filter_column()
+
+
+def test_get_check_columns():
+    rule_set = DQRuleColSet(columns=["a", "b"], check_func=is_not_null_and_not_empty)
+
+    check_columns = rule_set.get_check_columns()
+
+    assert [name for name, _ in check_columns] == ["col_a_is_null_or_empty", "col_b_is_null_or_empty"]
+
+
 def test_build_rules():
     actual_rules = DQEngineCore.build_checks(
         # set of columns for the same check
@@ -397,6 +427,41 @@ def test_build_checks_by_metadata_logging_debug_calls(caplog):
         assert "Resolving function: is_not_null_and_not_empty" in caplog.text
 
 
+def test_build_checks_by_metadata_resolves_each_function_once():
+    checks = [
+        {"criticality": "error", "check": {"function": "is_not_null", "arguments": {"col_names": ["a", "b"]}}},
+        {"criticality": "warn", "check": {"function": "is_not_null", "arguments": {"col_name": "c"}}},
+    ]
+
+    with patch.object(
+        DQEngineCore, "resolve_check_function", wraps=DQEngineCore.resolve_check_function
+    ) as resolve_check_function:
+        actual_rules = DQEngineCore.build_checks_by_metadata(checks)
+
+    assert len(actual_rules) == 3
+    resolve_check_function.assert_called_once()
+
+
+def test_build_checks_by_metadata_revalidates_modified_checks():
+    checks = [{"criticality": "error", "check": {"function": "is_not_null", "arguments": {"col_names": ["a", "b"]}}}]
+    DQEngineCore.build_checks_by_metadata(checks)
+
+    checks[0]["criticality"] = "invalid"
+    with pytest.raises(ValueError, match="Invalid value for 'criticality' field"):
+        DQEngineCore.build_checks_by_metadata(checks)
+
+
+def test_named_rules_introspect_check_function_once():
+    def check_func(col_name: str):
+        return sql_expression(f"{col_name} > 0")
+
+    with patch("databricks.labs.dqx.rule.inspect.signature", wraps=inspect.signature) as signature:
+        rules = DQRuleColSet(columns=["a", "b", "c"], check_func=check_func, name="col_is_positive").get_rules()
+
+    assert len(rules) == 3
+    signature.assert_called_once_with(check_func)
+
+
 def test_validate_check_func_arguments_too_many_positional():
     with pytest.raises(TypeError, match="takes 2 positional arguments but 3 were given"):
         DQRule(
@@ -417,3 +482,57 @@ def test_validate_check_func_arguments_invalid_keyword():
             col_name="col1",
             check_func_kwargs={"allowed": [3], "invalid_kwarg": "invalid_kwarg", "invalid_kwarg2": "invalid_kwarg2"},
         )
+
+
+def test_check_column_builds_check_once():
+    check_func = MagicMock(wraps=is_not_null_and_not_empty, __name__="is_not_null_and_not_empty")
+    rule = DQRule(name="col_x_is_null_or_empty", criticality="warn", check_func=check_func, col_name="x")
+
+    rule.check_column()
+    rule.check_column()
+
+    check_func.assert_called_once_with("x")
+
+
+def test_extra_params_default_run_time_is_taken_at_creation():
+    before = datetime.now()
+
+    extra_params = ExtraParams()
+
+    assert before <= extra_params.run_time <= datetime.now()
+
+
+def test_filter_column_is_parsed_once():
+    rule = DQRule(criticality="warn", check_func=is_not_null_and_not_empty, col_name="x", filter="y > 0")
+
+    assert rule.filter_column() is rule.filter_column()
+    assert DQRule(check_func=is_not_null_and_not_empty, col_name="x").filter_column() is None
+
+
+def test_named_rule_is_validated_without_building_check():
+    check_func = MagicMock(wraps=is_not_null_and_not_empty, __name__="is_not_null_and_not_empty")
+    check_func.__signature__ = inspect.signature(is_not_null_and_not_empty)
+
+    DQRule(name="col_x_is_null_or_empty", check_func=check_func, col_name="x")
+    check_func.assert_not_called()
+
+    with pytest.raises(TypeError):
+        DQRule(name="col_x_is_null_or_empty", check_func=check_func, col_name="x", check_func_args=[1, 2])
+
+
+def test_rule_arguments_are_not_shared_with_caller():
+    check_func_args: list = []
+    check_func_kwargs: dict = {}
+    rule = DQRule(
+        name="col_x_is_null_or_empty",
+        check_func=is_not_null_and_not_empty,
+        col_name="x",
+        check_func_args=check_func_args,
+        check_func_kwargs=check_func_kwargs,
+    )
+
+    check_func_args.append(True)
+    check_func_kwargs["trim_strings"] = True
+
+    assert not rule.check_func_args
+    assert not rule.check_func_kwargs
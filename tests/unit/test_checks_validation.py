@@ -1,5 +1,8 @@
+import inspect
+from unittest.mock import patch
+
 from pyspark.sql.functions import col
-from databricks.labs.dqx.engine import DQEngine
+from databricks.labs.dqx.engine import DQEngine, DQEngineCore, ChecksValidationStatus
 
 
 def dummy_func(col_name):
@@ -228,3 +231,51 @@ def test_unsupported_check_type():
     checks = ["unsupported_type"]
     status = DQEngine.validate_checks(checks)
     assert "Unsupported check type" in str(status)
+
+
+def test_check_function_resolved_once_per_name():
+    checks = [
+        {"criticality": "warn", "check": {"function": "is_not_null", "arguments": {"col_name": "col1"}}},
+        {"criticality": "error", "check": {"function": "is_not_null", "arguments": {"col_name": "col2"}}},
+        {"criticality": "warn", "check": {"function": "dummy_func", "arguments": {"col_name": "col3"}}},
+    ]
+    with patch.object(
+        DQEngineCore, "resolve_check_function", wraps=DQEngineCore.resolve_check_function
+    ) as resolve_check_function:
+        status = DQEngine.validate_checks(checks, {"dummy_func": dummy_func})
+
+    assert not status.has_errors
+    assert resolve_check_function.call_count == 2
+
+
+def test_check_function_signature_introspected_once():
+    def sig_func(col_name: str):
+        return col(col_name)
+
+    checks = [
+        {"criticality": "warn", "check": {"function": "sig_func", "arguments": {"col_name": "col1"}}},
+        {"criticality": "error", "check": {"function": "sig_func", "arguments": {"col_name": "col2"}}},
+    ]
+    with patch("inspect.signature", wraps=inspect.signature) as signature:
+        DQEngine.validate_checks(checks, {"sig_func": sig_func})
+        DQEngine.validate_checks(checks, {"sig_func": sig_func})
+
+    assert [call.args[0] for call in signature.call_args_list].count(sig_func) == 1
+
+
+def test_validation_status_string_reflects_added_errors():
+    status = ChecksValidationStatus()
+    assert str(status) == "No errors found"
+
+    status.add_error("first error")
+    assert str(status) == "first error"
+
+    status.add_errors(["second error", "third error"])
+    assert str(status) == "first error\nsecond error\nthird error"
+    assert status.errors == ["first error", "second error", "third error"]
+
+    status.errors.append("fourth error")
+    assert str(status) == "first error\nsecond error\nthird error\nfourth error"
+
+    status.errors[0] = "edited error"
+    assert str(status).startswith("edited error\n")
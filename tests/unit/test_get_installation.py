@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock, patch
+
+from databricks.labs.blueprint.installation import Installation, MockInstallation
+from databricks.labs.dqx.engine import DQEngine
+from databricks.sdk import WorkspaceClient
+
+
+def test_installation_verified_once_per_product():
+    ws = MagicMock(spec=WorkspaceClient, **{"catalogs.list.return_value": []})
+    dq_engine = DQEngine(ws)
+    installation = MockInstallation()
+
+    with (
+        patch.object(Installation, "assume_user_home", return_value=installation) as assume_user_home,
+        patch.object(Installation, "current") as current,
+    ):
+        assert dq_engine._get_installation(assume_user=True, product_name="dqx") is installation
+        assert dq_engine._get_installation(assume_user=True, product_name="dqx") is installation
+        assert assume_user_home.call_count == 1
+        assert current.call_count == 1
+
+        dq_engine.reset_installation_cache()
+        dq_engine._get_installation(assume_user=True, product_name="dqx")
+        assert assume_user_home.call_count == 2
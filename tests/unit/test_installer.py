@@ -1,7 +1,19 @@
 from unittest.mock import patch, MagicMock
 import pytest
-from databricks.labs.dqx.installer.install import WorkspaceInstaller, ManyError
+from databricks.labs.dqx.config import RunConfig, WorkspaceConfig
+from databricks.labs.dqx.installer.install import (
+    WorkspaceInstaller,
+    WorkspaceInstallation,
+    ManyError,
+    _dashboard_folders,
+)
+from databricks.labs.blueprint.installation import MockInstallation
+from databricks.labs.blueprint.installer import InstallState
+from databricks.labs.blueprint.tui import MockPrompts
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.errors import NotFound
+from databricks.sdk.service.dashboards import Dashboard, LifecycleState
+from databricks.sdk.service.sql import EndpointInfo, EndpointInfoWarehouseType, State
 
 
 def test_installer_executed_outside_workspace():
@@ -61,3 +73,119 @@ def test_extract_major_minor():
     assert WorkspaceInstaller.extract_major_minor("no version") is None
     assert WorkspaceInstaller.extract_major_minor("") is None
     assert WorkspaceInstaller.extract_major_minor("1") is None
+
+
+def test_configure_warehouse_lists_warehouses_once():
+    mock_ws_client = MagicMock(spec=WorkspaceClient)
+    mock_ws_client.warehouses.list.return_value = [
+        EndpointInfo(
+            id="abc",
+            name="Warehouse",
+            warehouse_type=EndpointInfoWarehouseType.PRO,
+            enable_serverless_compute=True,
+            state=State.RUNNING,
+        )
+    ]
+    installer = WorkspaceInstaller(mock_ws_client).replace(
+        prompts=MockPrompts({r".*PRO or SERVERLESS SQL warehouse.*": "1"})
+    )
+
+    assert installer.configure_warehouse() == "abc"
+    assert installer.configure_warehouse() == "abc"
+    mock_ws_client.warehouses.list.assert_called_once()
+
+
+def test_render_queries_leaves_source_folder_untouched(tmp_path):
+    folder = tmp_path / "quality" / "dashboard"
+    folder.mkdir(parents=True)
+    (folder / "00_query.sql").write_text("SELECT * FROM $catalog.schema.table", encoding="utf-8")
+    (folder / "dashboard.yml").write_text("display_name: Dashboard", encoding="utf-8")
+    target_folder = tmp_path / "rendered" / "dashboard"
+
+    rendered = WorkspaceInstallation._render_queries(
+        "$catalog.schema.table", "main.dqx.quarantine", folder, target_folder
+    )
+
+    assert rendered
+    assert (folder / "00_query.sql").read_text(encoding="utf-8") == "SELECT * FROM $catalog.schema.table"
+    assert (target_folder / "00_query.sql").read_text(encoding="utf-8") == "SELECT * FROM main.dqx.quarantine"
+    assert (target_folder / "dashboard.yml").read_text(encoding="utf-8") == "display_name: Dashboard"
+
+
+def test_run_skips_unchanged_dashboards():
+    ws = MagicMock(spec=WorkspaceClient)
+    installation = MockInstallation()
+    install_state = InstallState.from_installation(installation)
+    config = WorkspaceConfig(run_configs=[RunConfig(quarantine_table="main.dqx.quarantine", warehouse_id="123")])
+    product_info = MagicMock(**{"version.return_value": "0.1.0"})
+    workflows_installer = MagicMock()
+    installer = WorkspaceInstallation(
+        config, installation, install_state, ws, workflows_installer, MockPrompts({}), product_info
+    )
+
+    def create_dashboard(folder, *, parent_path):
+        install_state.dashboards[installer._dashboard_reference(folder)] = f"{parent_path}/{folder.name}"
+
+    with patch.object(installer, "_create_dashboard", side_effect=create_dashboard) as create_dashboard_mock:
+        installer.run()
+        installer.run()
+        assert create_dashboard_mock.call_count == len(_dashboard_folders())
+
+        config.run_configs[0].quarantine_table = "main.dqx.other_quarantine"
+        installer.run()
+        assert create_dashboard_mock.call_count == 2 * len(_dashboard_folders())
+
+
+def _make_installation(ws: WorkspaceClient, force_install: bool = False) -> WorkspaceInstallation:
+    installation = MockInstallation()
+    install_state = InstallState.from_installation(installation)
+    config = WorkspaceConfig(run_configs=[RunConfig(quarantine_table="main.dqx.quarantine", warehouse_id="123")])
+    product_info = MagicMock(**{"version.return_value": "0.1.0"})
+    return WorkspaceInstallation(
+        config, installation, install_state, ws, MagicMock(), MockPrompts({}), product_info, force_install
+    )
+
+
+@pytest.mark.parametrize(
+    "lakeview_get",
+    [
+        {"side_effect": NotFound("dashboard deleted")},
+        {"return_value": Dashboard(lifecycle_state=LifecycleState.TRASHED)},
+    ],
+)
+def test_run_recreates_missing_dashboards(lakeview_get):
+    ws = MagicMock(spec=WorkspaceClient)
+    installer = _make_installation(ws)
+
+    def create_dashboard(folder, *, parent_path):
+        installer._install_state.dashboards[installer._dashboard_reference(folder)] = f"{parent_path}/{folder.name}"
+
+    with patch.object(installer, "_create_dashboard", side_effect=create_dashboard) as create_dashboard_mock:
+        installer.run()
+        ws.lakeview.get.configure_mock(**lakeview_get)
+        installer.run()
+        assert create_dashboard_mock.call_count == 2 * len(_dashboard_folders())
+
+
+def test_run_with_force_install_reinstalls_dashboards():
+    ws = MagicMock(spec=WorkspaceClient)
+    installer = _make_installation(ws, force_install=True)
+
+    def create_dashboard(folder, *, parent_path):
+        installer._install_state.dashboards[installer._dashboard_reference(folder)] = f"{parent_path}/{folder.name}"
+
+    with patch.object(installer, "_create_dashboard", side_effect=create_dashboard) as create_dashboard_mock:
+        installer.run()
+        installer.run()
+        assert create_dashboard_mock.call_count == 2 * len(_dashboard_folders())
+
+
+
+def test_workflow_tasks_are_not_shared_between_installations():
+    ws = MagicMock(spec=WorkspaceClient)
+
+    tasks = WorkspaceInstaller(ws)._tasks
+    other_tasks = WorkspaceInstaller(ws)._tasks
+
+    assert tasks == other_tasks
+    assert all(task is not other_task for task, other_task in zip(tasks, other_tasks))
@@ -0,0 +1,17 @@
+from databricks.labs.blueprint.installation import MockInstallation
+from databricks.labs.dqx.engine import DQEngine
+
+CHECKS = [
+    {
+        "criticality": "error",
+        "check": {"function": "is_not_null", "arguments": {"col_names": ["col1", "col2"]}},
+    }
+]
+
+
+def test_load_checks_from_file():
+    installation = MockInstallation({"checks.yml": CHECKS})
+
+    checks = DQEngine._load_checks_from_file(installation, "checks.yml")
+
+    assert checks == CHECKS
@@ -1,3 +1,4 @@
+from decimal import Decimal
 import pyspark.sql.types as T
 from databricks.labs.dqx.profiler.profiler import DQProfiler
 
@@ -28,3 +29,51 @@ def test_get_columns_or_fields():
         T.StructField("ss1.s2.ns3", T.DateType()),
     ]
     assert fields == expected
+
+
+def test_get_columns_or_fields_returns_new_list_for_cached_schema():
+    inp = T.StructType([T.StructField("ss1", T.StructType([T.StructField("ns1", T.StringType())]))])
+
+    fields = DQProfiler.get_columns_or_fields(inp.fields)
+    fields.append(T.StructField("ts1", T.IntegerType()))
+
+    assert DQProfiler.get_columns_or_fields(inp.fields) == [T.StructField("ss1.ns1", T.StringType())]
+
+
+def test_summary_metrics_are_cast_to_column_type():
+    aggregates = {"count": "5", "mean": "2.5", "stddev": "1.5", "min": "1", "percentiles": ["1", "2", "3"], "max": "4"}
+
+    assert DQProfiler._to_summary_metrics(aggregates, T.IntegerType()) == {
+        "count": 5,
+        "mean": 2.5,
+        "stddev": 1.5,
+        "min": 1,
+        "25%": 1,
+        "50%": 2,
+        "75%": 3,
+        "max": 4,
+    }
+    string_metrics = DQProfiler._to_summary_metrics(aggregates, T.StringType())
+    assert string_metrics["count"] == "5"
+    assert string_metrics["mean"] == 2.5
+    assert string_metrics["min"] == "1"
+    double_metrics = DQProfiler._to_summary_metrics(aggregates, T.DoubleType())
+    assert isinstance(double_metrics["count"], float)
+    assert isinstance(double_metrics["max"], float)
+    decimal_metrics = DQProfiler._to_summary_metrics(aggregates, T.DecimalType(10, 2))
+    assert decimal_metrics["count"] == Decimal("5")
+
+
+def test_summary_metrics_of_non_numeric_strings():
+    aggregates = {"count": "2", "mean": None, "stddev": None, "min": "a", "percentiles": None, "max": "b"}
+
+    assert DQProfiler._to_summary_metrics(aggregates, T.StringType()) == {
+        "count": "2",
+        "mean": None,
+        "stddev": None,
+        "min": "a",
+        "25%": None,
+        "50%": None,
+        "75%": None,
+        "max": "b",
+    }
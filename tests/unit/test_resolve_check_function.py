@@ -28,3 +28,8 @@ def test_resolve_function_fail_on_missing():
 def test_resolve_function_not_fail_on_missing():
     result = DQEngineCore.resolve_check_function('missing_func', fail_on_missing=False)
     assert not result
+
+
+def test_resolve_function_ignores_names_imported_in_col_functions():
+    result = DQEngineCore.resolve_check_function('Column', fail_on_missing=False)
+    assert not result
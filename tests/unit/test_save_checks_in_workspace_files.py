@@ -0,0 +1,29 @@
+from unittest.mock import MagicMock
+import yaml
+
+from databricks.labs.dqx.engine import DQEngine
+from databricks.sdk import WorkspaceClient
+
+CHECKS = [
+    {
+        "criticality": "error",
+        "check": {"function": "is_not_null", "arguments": {"col_names": ["col1", "col2"]}},
+    }
+]
+
+
+def test_save_checks_in_workspace_files():
+    ws = MagicMock(spec=WorkspaceClient, **{"catalogs.list.return_value": []})
+    dq_engine = DQEngine(ws)
+    checks_by_path = {
+        "/Shared/App1/checks.yml": CHECKS,
+        "/Shared/App1/other_checks.yml": CHECKS,
+        "/Shared/App2/checks.yml": [],
+    }
+
+    dq_engine.save_checks_in_workspace_files(checks_by_path)
+
+    mkdirs_calls = sorted(call.args[0] for call in ws.workspace.mkdirs.call_args_list)
+    assert mkdirs_calls == ["/Shared/App1", "/Shared/App2"]
+    uploaded = {call.args[0]: yaml.safe_load(call.args[1]) for call in ws.workspace.upload.call_args_list}
+    assert uploaded == checks_by_path